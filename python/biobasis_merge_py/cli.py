@@ -30,6 +30,12 @@ def create_parser() -> argparse.ArgumentParser:
         help="Overwrite existing output files"
     )
     
+    parser.add_argument(
+        "--no-plots",
+        action="store_true",
+        help="Skip generating the HTML plot files"
+    )
+    
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -50,7 +56,8 @@ def main():
             config_path=args.config,
             dry_run=args.dry_run,
             overwrite=args.overwrite,
-            log_level=args.log_level
+            log_level=args.log_level,
+            no_plots=args.no_plots
         )
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1,24 +1,32 @@
 """File I/O operations for reading and discovering Biobasis data files."""
 
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Set
 import logging
 from .parse_header import parse_header, get_timestamp_column_info
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = pa_csv = None
+
 logger = logging.getLogger(__name__)
 
 
 def build_expected_file_list(input_dir: str, date_start: datetime, date_end: datetime) -> List[Tuple[datetime, str]]:
     """Build list of expected daily files in date range."""
-    from .utils import generate_date_list
+    from .utils import generate_date_index
     
     input_path = Path(input_dir)
     expected_files = []
     
-    for date in generate_date_list(date_start, date_end):
-        date_str = date.strftime('%Y%m%d')
+    dates = generate_date_index(date_start, date_end)
+    for date, date_str in zip(dates.to_pydatetime(), dates.strftime('%Y%m%d')):
         filename = f"Biobasis_MM1_{date_str}.dat"
         file_path = input_path / filename
         expected_files.append((date, str(file_path)))
@@ -26,13 +34,31 @@ def build_expected_file_list(input_dir: str, date_start: datetime, date_end: dat
     return expected_files
 
 
+def _list_directory(directory: str) -> Set[str]:
+    """Return the entry names in a directory, or an empty set if it does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def check_file_existence(file_list: List[Tuple[datetime, str]]) -> Tuple[List[Tuple[datetime, str]], List[Tuple[datetime, str]]]:
-    """Check which files exist and return (existing, missing) lists."""
+    """
+    Check which files exist and return (existing, missing) lists.
+    
+    Each directory is listed once with os.scandir instead of stat-ing every file.
+    """
     existing = []
     missing = []
+    directory_names = {}
     
     for date, file_path in file_list:
-        if Path(file_path).exists():
+        directory, filename = os.path.split(file_path)
+        if directory not in directory_names:
+            directory_names[directory] = _list_directory(directory or '.')
+        
+        if filename in directory_names[directory]:
             existing.append((date, file_path))
         else:
             missing.append((date, file_path))
@@ -41,43 +67,102 @@ def check_file_existence(file_list: List[Tuple[datetime, str]]) -> Tuple[List[Tu
     return existing, missing
 
 
+# Missing-value markers written by Campbell Scientific loggers and pandas defaults
+NULL_VALUES = ['', 'NAN', 'NaN', 'nan', 'NA', 'N/A', 'null', 'NULL']
+
+
+def _read_data_pyarrow(file_path: str, column_names: List[str], timestamp_col: str) -> pd.DataFrame:
+    """Read data rows with the multi-threaded PyArrow CSV reader, typing columns in one pass."""
+    table = pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(skip_rows=4, column_names=column_names),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={timestamp_col: pa.timestamp('ns')},
+            null_values=NULL_VALUES,
+            strings_can_be_null=True,
+            timestamp_parsers=['%Y-%m-%d %H:%M:%S', pa_csv.ISO8601]
+        )
+    )
+    # An all-missing column (e.g. a failed sensor logging "NAN") is typed as null,
+    # which pandas would read as object; use float64 to match the pandas reader
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas()
+
+
+def _read_data_pandas(file_path: str, column_names: List[str], timestamp_col: str) -> pd.DataFrame:
+    """Read data rows with the pandas C parser, inferring column types in a single pass."""
+    df = pd.read_csv(
+        file_path,
+        skiprows=4,
+        names=column_names,
+        na_values=NULL_VALUES,
+        parse_dates=[timestamp_col],
+        cache_dates=True,
+        low_memory=False,  # Infer each column's type once over the whole file
+        engine='c'
+    )
+    
+    if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
+        # Convert timestamp to datetime without timezone info
+        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+    
+    return df
+
+
+def _categorize_repeated(df: pd.DataFrame, threshold: float = 0.5) -> pd.DataFrame:
+    """Convert object columns with fewer than threshold distinct values per row to category, in place."""
+    if len(df) == 0:
+        return df
+    for col in df.select_dtypes(include='object').columns:
+        n_unique = df[col].nunique()
+        # Skip all-missing columns; an empty categorical would not concat or plot
+        if 0 < n_unique / len(df) < threshold:
+            df[col] = df[col].astype('category')
+    return df
+
+
 def read_data_file(file_path: str) -> Tuple[pd.DataFrame, Dict[str, str], Dict[str, str]]:
     """
     Read a single Biobasis data file.
     
+    Uses the PyArrow CSV reader when available, falling back to the pandas
+    parser if pyarrow is not installed or cannot parse the file. Columns that
+    neither reader could type as numeric are coerced afterwards, and text
+    columns with repeated values are stored as categoricals.
+    
     Returns:
         Tuple of (dataframe, units_dict, stats_dict)
     """
     try:
         # Parse header first
         column_names, units_dict, stats_dict = parse_header(file_path)
-        
-        # Read data starting from line 5 (0-indexed line 4)
-        df = pd.read_csv(
-            file_path,
-            skiprows=4,
-            names=column_names,
-            parse_dates=False,  # We'll handle timestamp parsing separately
-            dtype=str  # Read all columns as strings first to avoid conversion errors
-        )
-        
-        # Parse timestamp column
         timestamp_col = get_timestamp_column_info(column_names)
         
-        if timestamp_col in df.columns:
-            # Convert timestamp to datetime without timezone info
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+        # Read data starting from line 5 (0-indexed line 4)
+        df = None
+        if pa_csv is not None:
+            try:
+                df = _read_data_pyarrow(file_path, column_names, timestamp_col)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                logger.debug("PyArrow could not parse %s, falling back to pandas: %s", file_path, e)
+        if df is None:
+            df = _read_data_pandas(file_path, column_names, timestamp_col)
         
-        # Convert numeric columns, handling errors gracefully
+        # Convert remaining string columns to numeric, handling errors gracefully
         for col in df.columns:
-            if col != timestamp_col:  # Skip timestamp column
+            if col != timestamp_col and df[col].dtype == object:  # Skip timestamp column
                 # Try to convert to numeric, keeping as string if it fails
                 numeric_series = pd.to_numeric(df[col], errors='coerce')
                 # Only convert if we have at least some valid numeric values
                 if not numeric_series.isna().all():
                     df[col] = numeric_series
         
-        logger.debug(f"Read {len(df)} rows from {file_path}")
+        # Text columns such as status codes and flags hold few distinct values
+        _categorize_repeated(df)
+        
+        logger.debug("Read %d rows from %s", len(df), file_path)
         return df, units_dict, stats_dict
         
     except Exception as e:
@@ -85,10 +170,24 @@ def read_data_file(file_path: str) -> Tuple[pd.DataFrame, Dict[str, str], Dict[s
         raise
 
 
+def _try_read_data_file(file_path: str) -> Optional[Tuple[pd.DataFrame, Dict[str, str], Dict[str, str]]]:
+    """Read a data file, logging and returning None on failure."""
+    try:
+        result = read_data_file(file_path)
+        logger.debug("Successfully loaded %s", file_path)
+        return result
+    except Exception as e:
+        logger.warning("Failed to load %s: %s", file_path, e)
+        return None
+
+
 def load_all_files(file_list: List[Tuple[datetime, str]]) -> Tuple[List[pd.DataFrame], List[Dict[str, str]], List[Dict[str, str]]]:
     """
     Load all existing data files.
     
+    Files are read concurrently in a thread pool (the pandas C parser releases
+    the GIL); results are collected in the order of file_list.
+    
     Returns:
         Tuple of (dataframes_list, units_list, stats_list)
     """
@@ -96,25 +195,33 @@ def load_all_files(file_list: List[Tuple[datetime, str]]) -> Tuple[List[pd.DataF
     units_list = []
     stats_list = []
     
-    for date, file_path in file_list:
-        try:
-            df, units_dict, stats_dict = read_data_file(file_path)
-            dataframes.append(df)
-            units_list.append(units_dict)
-            stats_list.append(stats_dict)
-            logger.debug(f"Successfully loaded {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to load {file_path}: {e}")
+    if not file_list:
+        logger.info("Successfully loaded 0 files")
+        return dataframes, units_list, stats_list
+    
+    file_paths = [file_path for _, file_path in file_list]
+    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+        results = list(executor.map(_try_read_data_file, file_paths))
+    
+    for result in results:
+        if result is None:
             continue
+        df, units_dict, stats_dict = result
+        dataframes.append(df)
+        units_list.append(units_dict)
+        stats_list.append(stats_dict)
     
     logger.info(f"Successfully loaded {len(dataframes)} files")
     return dataframes, units_list, stats_list
 
 
-def validate_output_paths(output_dir: str, date_range: str, overwrite: bool = False) -> Dict[str, str]:
+def validate_output_paths(output_dir: str, date_range: str, overwrite: bool = False,
+                          include_plots: bool = True) -> Dict[str, str]:
     """
     Validate output file paths and check for existing files.
     
+    The 'plots' path is left out when include_plots is False.
+    
     Returns:
         Dictionary of output file paths
     """
@@ -126,6 +233,8 @@ def validate_output_paths(output_dir: str, date_range: str, overwrite: bool = Fa
         'metadata': str(output_path / f"{base_name}_metadata.csv"),
         'plots': str(output_path / f"{base_name}_plots.html")
     }
+    if not include_plots:
+        del output_files['plots']
     
     # Check for existing files
     existing_files = []
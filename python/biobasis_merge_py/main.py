@@ -1,7 +1,9 @@
 """Main orchestration pipeline for biobasis_merge_py."""
 
 import logging
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -12,26 +14,87 @@ from .io_files import (
 from .merge_logic import merge_daily_data, get_merge_summary
 from .metadata import consolidate_metadata, create_metadata_dataframe, save_metadata, validate_metadata_consistency
 from .plots import create_time_series_plots, create_summary_plot, validate_plot_output
-from .parse_header import get_timestamp_column_info
+from .parse_header import get_timestamp_column_info, parse_headers_batch, validate_header_consistency
 from .meteorology import add_meteorological_calculations
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to DataFrame.to_csv
+    pa = pc = pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _write_csv_pyarrow(df: pd.DataFrame, output_path: str) -> None:
+    """
+    Write a dataframe with the PyArrow CSV writer, rendering missing values as 'NaN'.
+    
+    Datetime columns are formatted with TIMESTAMP_FORMAT by Arrow while the
+    columns are converted, so no formatted copy is made in pandas. Other columns
+    are formatted as to_csv does, so both writers produce the same bytes: floats
+    by NumPy (Arrow alone would write 0.0 as '0' and 1e-05 as '0.00001') and
+    booleans as 'True'/'False'. Columns of any other type (e.g. timedelta) raise
+    ArrowTypeError so that the caller falls back to to_csv.
+    """
+    header = [str(col) for col in df.columns]
+    if any(',' in name or '"' in name or '\n' in name for name in header):
+        raise pa.ArrowInvalid("Column names require quoting")
+    
+    columns = {}
+    for name, col in zip(header, df.columns):
+        series = df[col]
+        if series.dtype.kind == 'f':
+            values = series.to_numpy(na_value=np.nan)
+            arr = pa.array(values.astype(str), mask=np.isnan(values))
+        else:
+            arr = pa.array(series, from_pandas=True)
+        if pa.types.is_dictionary(arr.type) and pa.types.is_string(arr.type.value_type):
+            arr = arr.dictionary_decode()
+        
+        if pa.types.is_timestamp(arr.type):
+            # Truncate to whole seconds so %S does not print fractional digits
+            arr = pc.strftime(arr.cast(pa.timestamp('s', tz=arr.type.tz), safe=False), format=TIMESTAMP_FORMAT)
+        elif pa.types.is_boolean(arr.type):
+            arr = pc.if_else(arr, 'True', 'False')
+        elif pa.types.is_integer(arr.type) or pa.types.is_null(arr.type):
+            arr = pc.cast(arr, pa.string())
+        elif not pa.types.is_string(arr.type):
+            raise pa.ArrowTypeError(f"Column {name} ({series.dtype}) is written by to_csv")
+        columns[name] = pc.fill_null(arr, 'NaN')
+    
+    # PyArrow always quotes header names, so the header is written separately;
+    # quoting_style='none' keeps values unquoted like to_csv and raises if one needs quoting
+    with pa.OSFile(output_path, 'wb') as sink:
+        sink.write((','.join(header) + '\n').encode('utf-8'))
+        pa_csv.write_csv(
+            pa.table(columns),
+            sink,
+            write_options=pa_csv.WriteOptions(include_header=False, quoting_style='none')
+        )
+
 
 def save_merged_data(df, output_files: dict) -> None:
-    """Save merged data in multiple formats."""
+    """
+    Save merged data in multiple formats.
+    
+    The CSV is written in a single pass: timestamps are formatted by the writer
+    (PyArrow, or date_format in the pandas fallback) rather than beforehand.
+    """
     try:
-        # Prepare dataframe for output
-        output_df = df.copy()
-        
-        # Format timestamp column to simple format (no timezone)
-        timestamp_cols = [col for col in output_df.columns if 'TIMESTAMP' in col.upper()]
-        for col in timestamp_cols:
-            if pd.api.types.is_datetime64_any_dtype(output_df[col]):
-                output_df[col] = output_df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
         # Save as uncompressed CSV with explicit NaN handling
-        output_df.to_csv(output_files['csv'], index=False, na_rep='NaN')
+        written = False
+        if pa_csv is not None:
+            try:
+                _write_csv_pyarrow(df, output_files['csv'])
+                written = True
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                logger.debug("PyArrow CSV writer failed, falling back to pandas: %s", e)
+        if not written:
+            df.to_csv(output_files['csv'], index=False, na_rep='NaN', date_format=TIMESTAMP_FORMAT)
         logger.info(f"Saved CSV file: {output_files['csv']}")
         
     except Exception as e:
@@ -39,6 +102,16 @@ def save_merged_data(df, output_files: dict) -> None:
         raise
 
 
+def create_plots(df, timestamp_col: str, merge_summary: dict, output_path: str) -> None:
+    """Create the time series and summary plots and validate the plot file."""
+    create_time_series_plots(df, timestamp_col, output_path)
+    create_summary_plot(merge_summary, output_path)
+    
+    # Validate plot output
+    if not validate_plot_output(output_path):
+        logger.warning("Plot file validation failed")
+
+
 def print_processing_summary(config: dict, existing_files: list, missing_files: list, 
                            merge_summary: dict, output_files: dict) -> None:
     """Print comprehensive processing summary."""
@@ -77,8 +150,14 @@ def print_processing_summary(config: dict, existing_files: list, missing_files:
     print("\n" + "="*60)
 
 
-def main_pipeline(config_path: str, dry_run: bool = False, overwrite: bool = False, log_level: str = "INFO") -> None:
-    """Main processing pipeline."""
+def main_pipeline(config_path: str, dry_run: bool = False, overwrite: bool = False, log_level: str = "INFO",
+                  no_plots: bool = False) -> None:
+    """
+    Main processing pipeline.
+    
+    Plots are skipped when no_plots is True or the config sets
+    output_formats.plots to false.
+    """
     
     # Setup logging
     setup_logging(log_level)
@@ -99,8 +178,11 @@ def main_pipeline(config_path: str, dry_run: bool = False, overwrite: bool = Fal
         # Validate and create output directory
         output_dir = validate_output_dir(config['output_dir'], create=not dry_run)
         
+        # Plots are the slowest output, so batch runs can turn them off
+        make_plots = not no_plots and (config.get('output_formats') or {}).get('plots', True)
+        
         # Validate output file paths
-        output_files = validate_output_paths(config['output_dir'], date_range, overwrite)
+        output_files = validate_output_paths(config['output_dir'], date_range, overwrite, include_plots=make_plots)
         
         # Build expected file list
         expected_files = build_expected_file_list(config['input_dir'], date_start, date_end)
@@ -117,6 +199,14 @@ def main_pipeline(config_path: str, dry_run: bool = False, overwrite: bool = Fal
             print(f"Output files would be created in: {config['output_dir']}")
             return
         
+        # Check that all files have the same columns before loading them. Headers
+        # are parsed concurrently and cached, so loading does not read them again
+        try:
+            validate_header_consistency(parse_headers_batch([file_path for _, file_path in existing_files]))
+        except (OSError, ValueError) as e:
+            # Unreadable files are logged and skipped again by load_all_files
+            logger.warning(f"Skipping header consistency check: {e}")
+        
         # Load all data files
         dataframes, units_list, stats_list = load_all_files(existing_files)
         
@@ -134,25 +224,32 @@ def main_pipeline(config_path: str, dry_run: bool = False, overwrite: bool = Fal
         merged_df = merge_daily_data(dataframes, date_start, date_end)
         
         # Get timestamp column for summary
-        timestamp_col = get_timestamp_column_info(list(merged_df.columns))
+        timestamp_col = get_timestamp_column_info(merged_df.columns)
         
         # Add meteorological calculations (WBGT, etc.)
-        merged_df = add_meteorological_calculations(merged_df)
+        merged_df = add_meteorological_calculations(
+            merged_df, precision=config.get('meteorology_precision', 'float64')
+        )
         
         # Generate merge summary
         merge_summary = get_merge_summary(merged_df, timestamp_col, date_start, date_end)
         
-        # Save outputs
-        save_merged_data(merged_df, output_files)
-        save_metadata(metadata_df, output_files['metadata'])
-        
-        # Create plots
-        create_time_series_plots(merged_df, timestamp_col, output_files['plots'])
-        create_summary_plot(merge_summary, output_files['plots'])
-        
-        # Validate plot output
-        if not validate_plot_output(output_files['plots']):
-            logger.warning("Plot file validation failed")
+        # Save outputs and create plots concurrently; the tasks only read merged_df
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(save_merged_data, merged_df, output_files),
+                executor.submit(save_metadata, metadata_df, output_files['metadata']),
+            ]
+            if make_plots:
+                futures.append(executor.submit(
+                    create_plots, merged_df, timestamp_col, merge_summary, output_files['plots']
+                ))
+            else:
+                logger.info("Skipping plot generation")
+            
+            # Re-raise the first failure; the executor still waits for the other tasks
+            for future in as_completed(futures):
+                future.result()
         
         # Print summary
         print_processing_summary(config, existing_files, missing_files, merge_summary, output_files)
@@ -1,6 +1,10 @@
 """Data merging and reindexing logic."""
 
+import numpy as np
 import pandas as pd
+from functools import lru_cache
+from pandas.api.types import union_categoricals
+from pandas.tseries.frequencies import to_offset
 from datetime import datetime, timedelta
 from typing import List, Tuple
 import logging
@@ -9,25 +13,67 @@ from .parse_header import get_timestamp_column_info
 logger = logging.getLogger(__name__)
 
 
+def unify_categories(dataframes: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    Give categorical columns the same categories in every dataframe.
+    
+    pd.concat only keeps a column categorical when its categories match, so
+    differing categories are replaced by their union. Dataframes that need
+    changes are shallow-copied; the inputs are not modified.
+    """
+    columns = {col for df in dataframes for col in df.select_dtypes('category').columns}
+    if not columns:
+        return dataframes
+    
+    dataframes = list(dataframes)
+    for col in columns:
+        series = [df[col] for df in dataframes if col in df.columns]
+        if not all(isinstance(s.dtype, pd.CategoricalDtype) for s in series):
+            continue  # Mixed dtypes are concatenated as object
+        if all(s.dtype == series[0].dtype for s in series[1:]):
+            continue
+        
+        categories = union_categoricals(series, ignore_order=True).categories
+        for i, df in enumerate(dataframes):
+            if col in df.columns:
+                df = df.copy(deep=False)
+                df[col] = df[col].cat.set_categories(categories)
+                dataframes[i] = df
+    
+    return dataframes
+
+
 def concatenate_dataframes(dataframes: List[pd.DataFrame]) -> pd.DataFrame:
     """Concatenate all dataframes into a single dataframe."""
     if not dataframes:
         raise ValueError("No dataframes to concatenate")
     
-    # Concatenate all dataframes
-    merged_df = pd.concat(dataframes, ignore_index=True)
+    dataframes = unify_categories(dataframes)
+    
+    # Concatenate all dataframes; columns are kept in file order rather than sorted
+    merged_df = pd.concat(dataframes, ignore_index=True, sort=False)
     logger.info(f"Concatenated {len(dataframes)} dataframes into {len(merged_df)} rows")
     
     return merged_df
 
 
 def sort_by_timestamp(df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
-    """Sort dataframe by timestamp column."""
+    """
+    Sort dataframe by timestamp column.
+    
+    Already-sorted data is returned unchanged. Otherwise a stable sort is used,
+    so rows with equal timestamps keep their input order and the sort runs in
+    near-linear time over the pre-sorted per-day runs.
+    """
     if timestamp_col not in df.columns:
         raise ValueError(f"Timestamp column '{timestamp_col}' not found in dataframe")
     
-    sorted_df = df.sort_values(by=timestamp_col).reset_index(drop=True)
-    logger.debug(f"Sorted dataframe by {timestamp_col}")
+    if df[timestamp_col].is_monotonic_increasing:
+        logger.debug("Dataframe already sorted by %s", timestamp_col)
+        return df
+    
+    sorted_df = df.sort_values(by=timestamp_col, kind='stable').reset_index(drop=True)
+    logger.debug("Sorted dataframe by %s", timestamp_col)
     
     return sorted_df
 
@@ -46,10 +92,13 @@ def remove_duplicates(df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
     return deduped_df
 
 
+@lru_cache(maxsize=4)
 def create_complete_time_index(date_start: datetime, date_end: datetime, freq: str = '30T') -> pd.DatetimeIndex:
     """
     Create complete time index from start 00:00:00 to end 23:30:00 at specified frequency.
     
+    The index is cached, so the merge and the summary share the same object.
+    
     Args:
         date_start: Start date
         date_end: End date
@@ -58,13 +107,13 @@ def create_complete_time_index(date_start: datetime, date_end: datetime, freq: s
     # Create start and end timestamps
     start_timestamp = pd.Timestamp(date_start.replace(hour=0, minute=0, second=0))
     end_timestamp = pd.Timestamp(date_end.replace(hour=23, minute=30, second=0))
+    step = to_offset(freq.replace('T', 'min') if 'T' in freq else freq)
     
-    # Create complete time index
-    complete_index = pd.date_range(
-        start=start_timestamp,
-        end=end_timestamp,
-        freq=freq.replace('T', 'min') if 'T' in freq else freq
-    )
+    # Build the index directly from evenly spaced int64 nanoseconds, end inclusive;
+    # offsets are counted from zero since np.arange computes its length in float64
+    periods = (end_timestamp.value - start_timestamp.value) // step.nanos + 1
+    values = start_timestamp.value + np.arange(periods, dtype='i8') * step.nanos
+    complete_index = pd.DatetimeIndex(values.view('datetime64[ns]'))
     
     logger.info(f"Created complete time index with {len(complete_index)} timestamps")
     return complete_index
@@ -73,25 +122,27 @@ def create_complete_time_index(date_start: datetime, date_end: datetime, freq: s
 def reindex_to_complete_grid(df: pd.DataFrame, timestamp_col: str, date_start: datetime, date_end: datetime) -> pd.DataFrame:
     """
     Reindex dataframe to complete 30-minute grid, filling missing values with NaN.
+    
+    The data is left-joined onto a grid dataframe, which keeps the column order
+    and raises pandas.errors.MergeError if timestamps are duplicated.
     """
     if timestamp_col not in df.columns:
         raise ValueError(f"Timestamp column '{timestamp_col}' not found in dataframe")
     
-    # Create complete time index
+    # Create complete time index, matching the timezone of the data
     complete_index = create_complete_time_index(date_start, date_end)
+    tz = getattr(df[timestamp_col].dtype, 'tz', None)
+    if tz is not None:
+        complete_index = complete_index.tz_localize(tz)
     
-    # Set timestamp as index
-    df_indexed = df.set_index(timestamp_col)
-    
-    # Reindex to complete grid
-    reindexed_df = df_indexed.reindex(complete_index)
-    
-    # Reset index to make timestamp a column again
-    reindexed_df = reindexed_df.reset_index()
-    reindexed_df = reindexed_df.rename(columns={'index': timestamp_col})
+    # Left-join the data onto the complete grid
+    grid_df = pd.DataFrame({timestamp_col: complete_index})
+    reindexed_df = grid_df.merge(df, on=timestamp_col, how='left', validate='one_to_one')
     
-    missing_count = reindexed_df.isnull().sum().sum()
-    logger.info(f"Reindexed to complete grid: {len(reindexed_df)} timestamps, {missing_count} missing values")
+    # Counting missing values scans the whole frame, so only do it when it is logged
+    if logger.isEnabledFor(logging.INFO):
+        missing_count = reindexed_df.isnull().sum().sum()
+        logger.info(f"Reindexed to complete grid: {len(reindexed_df)} timestamps, {missing_count} missing values")
     
     return reindexed_df
 
@@ -110,14 +161,14 @@ def merge_daily_data(dataframes: List[pd.DataFrame], date_start: datetime, date_
         raise ValueError("No dataframes provided for merging")
     
     # Get timestamp column name from first dataframe
-    timestamp_col = get_timestamp_column_info(list(dataframes[0].columns))
+    timestamp_col = get_timestamp_column_info(dataframes[0].columns)
     
     logger.info("Starting data merge pipeline")
     
     # Step 1: Concatenate
     merged_df = concatenate_dataframes(dataframes)
     
-    # Step 2: Sort by timestamp
+    # Step 2: Sort by timestamp (no-op when the daily files are already in order)
     merged_df = sort_by_timestamp(merged_df, timestamp_col)
     
     # Step 3: Remove duplicates
@@ -7,44 +7,41 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _first_non_empty(dicts: List[Dict[str, str]]) -> Dict[str, str]:
+    """Map each column to its first non-empty stripped value, or "" if there is none."""
+    first = dicts[0]
+    if all(values == first for values in dicts[1:]):
+        # Every file has the same header (the normal case), so the first one decides
+        return {column: value.strip() if value else "" for column, value in first.items()}
+    
+    consolidated = {}
+    for values in dicts:
+        for column, value in values.items():
+            if not consolidated.get(column):
+                consolidated[column] = value.strip() if value else ""
+    return consolidated
+
+
 def consolidate_metadata(units_list: List[Dict[str, str]], stats_list: List[Dict[str, str]]) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Consolidate units and statistics metadata across multiple files.
     
     Strategy: For each column, use the first non-empty/non-NA value encountered.
+    Each list is scanned once, so the cost is linear in the number of entries.
     """
     if not units_list or not stats_list:
         return {}, {}
     
-    # Get all unique column names
-    all_columns = set()
-    for units_dict in units_list:
-        all_columns.update(units_dict.keys())
-    for stats_dict in stats_list:
-        all_columns.update(stats_dict.keys())
+    consolidated_units = _first_non_empty(units_list)
+    consolidated_stats = _first_non_empty(stats_list)
     
-    consolidated_units = {}
-    consolidated_stats = {}
-    
-    # For each column, find first non-empty unit and stat
-    for column in all_columns:
-        # Consolidate units
-        unit_value = ""
-        for units_dict in units_list:
-            if column in units_dict and units_dict[column] and units_dict[column].strip():
-                unit_value = units_dict[column].strip()
-                break
-        consolidated_units[column] = unit_value
-        
-        # Consolidate stats
-        stat_value = ""
-        for stats_dict in stats_list:
-            if column in stats_dict and stats_dict[column] and stats_dict[column].strip():
-                stat_value = stats_dict[column].strip()
-                break
-        consolidated_stats[column] = stat_value
+    # Columns only present in one of the lists get an empty value in the other
+    for column in consolidated_stats.keys() - consolidated_units.keys():
+        consolidated_units[column] = ""
+    for column in consolidated_units.keys() - consolidated_stats.keys():
+        consolidated_stats[column] = ""
     
-    logger.info(f"Consolidated metadata for {len(all_columns)} columns")
+    logger.info(f"Consolidated metadata for {len(consolidated_units)} columns")
     return consolidated_units, consolidated_stats
 
 
@@ -1,11 +1,36 @@
 """Meteorological calculations for WBGT and related parameters."""
 
-import pandas as pd
+import math
 import numpy as np
 import logging
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Coefficients from Campbell Scientific manual (A0..A6, ascending powers of T)
+_ESAT_COEFFS = (
+    6.107799961,
+    4.436518521E-1,
+    1.428945805E-2,
+    2.650648471E-4,
+    3.031240396E-6,
+    2.034080948E-8,
+    6.136820929E-11,
+)
+_ESAT_DERIV_COEFFS = tuple(float(c) for c in np.polynomial.polynomial.polyder(_ESAT_COEFFS))
+
+
+def _horner(x, coeffs):
+    """Evaluate a polynomial with ascending coefficients at x using Horner's scheme."""
+    result = coeffs[-1] * x + coeffs[-2]
+    for c in reversed(coeffs[:-2]):
+        result = result * x + c
+    return result
+
 
 def calculate_saturated_vapor_pressure(T):
     """
@@ -17,16 +42,7 @@ def calculate_saturated_vapor_pressure(T):
     Returns:
         esat: Saturated vapor pressure in kPa
     """
-    # Coefficients from Campbell Scientific manual
-    A0 = 6.107799961
-    A1 = 4.436518521E-1
-    A2 = 1.428945805E-2
-    A3 = 2.650648471E-4
-    A4 = 3.031240396E-6
-    A5 = 2.034080948E-8
-    A6 = 6.136820929E-11
-    
-    esat = (A0 + A1*T + A2*T**2 + A3*T**3 + A4*T**4 + A5*T**5 + A6*T**6) * 0.1
+    esat = _horner(T, _ESAT_COEFFS) * 0.1
     
     return esat
 
@@ -51,20 +67,20 @@ def calculate_dewpoint(ea):
     Calculate dewpoint temperature using Teten's equation.
     
     Args:
-        ea: Vapor pressure in kPa
+        ea: Vapor pressure in kPa (scalar or array)
     
     Returns:
-        Td: Dewpoint temperature in °C
+        Td: Dewpoint temperature in °C (NaN where ea is missing or <= 0)
     """
-    # Handle edge cases
-    if pd.isna(ea) or ea <= 0:
-        return np.nan
+    ea = np.asarray(ea)
+    ea = ea.astype(np.result_type(ea, np.float32), copy=False)
     
-    # Teten's equation (inverse)
-    ln_ea = np.log(ea / 0.61078)
-    Td = (241.88 * ln_ea) / (17.558 - ln_ea)
+    # Teten's equation (inverse), masking non-positive vapor pressures
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ln_ea = np.log(np.where(ea > 0, ea, np.nan) / 0.61078)
+        Td = (241.88 * ln_ea) / (17.558 - ln_ea)
     
-    return Td
+    return Td[()]
 
 
 def calculate_wet_bulb_vapor_pressure(T, Tw, SP):
@@ -88,56 +104,126 @@ def calculate_wet_bulb_vapor_pressure(T, Tw, SP):
     return ewt
 
 
-def calculate_wet_bulb_temperature(T, ea, SP, max_iterations=50, tolerance=0.01):
+def _solve_wet_bulb_numpy(T, ea, SP, max_iterations, tolerance):
+    """Vectorized NumPy Newton solver; returns (Tw, number of unconverged values)."""
+    # Calculate dewpoint as initial guess
+    Td = calculate_dewpoint(ea)
+    Tw = np.where(np.isnan(T) | np.isnan(SP), np.nan, Td).astype(T.dtype, copy=False)
+    active = ~np.isnan(Tw)
+    converged_any = np.zeros(Tw.shape, dtype=bool)
+    valid = active.copy()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            if not active.any():
+                break
+            
+            # Residual between wet-bulb vapor pressure and actual vapor pressure
+            diff = calculate_wet_bulb_vapor_pressure(T, Tw, SP) - ea
+            
+            # Analytical derivative of the residual with respect to Tw
+            deriv = (
+                _horner(Tw, _ESAT_DERIV_COEFFS) * 0.1
+                + 0.000660 * SP * (1 + 0.00115 * Tw - 0.00115 * (T - Tw))
+            )
+            
+            Tw_new = np.where(active, Tw - diff / deriv, Tw)
+            converged = active & (np.abs(Tw_new - Tw) < tolerance)
+            converged_any |= converged
+            Tw = Tw_new
+            
+            # Ensure wet-bulb temperature stays within reasonable bounds
+            out_of_bounds = (Tw < Td - 5) | (Tw > T + 5)
+            active &= ~(converged | out_of_bounds)
+    
+    return Tw.astype(T.dtype, copy=False), int((valid & ~converged_any).sum())
+
+
+if njit is not None:
+    # fastmath without the 'nnan'/'ninf' flags so that NaN inputs are still detected
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _wet_bulb_kernel(T, ea, SP, out, max_iterations, tolerance):
+        """Numba Newton solver writing Tw into out; returns number of unconverged values."""
+        A0, A1, A2, A3, A4, A5, A6 = _ESAT_COEFFS
+        unconverged = 0
+        for i in prange(T.shape[0]):
+            t = T[i]
+            e = ea[i]
+            sp = SP[i]
+            if math.isnan(t) or math.isnan(e) or math.isnan(sp) or e <= 0:
+                out[i] = np.nan
+                continue
+            
+            # Dewpoint (inverse Teten's equation) as initial guess
+            ln_ea = math.log(e / 0.61078)
+            td = (241.88 * ln_ea) / (17.558 - ln_ea)
+            tw = td
+            converged = False
+            for _ in range(max_iterations):
+                # Saturated vapor pressure at Tw and its derivative (Horner form)
+                eswt = (A0 + tw * (A1 + tw * (A2 + tw * (A3 + tw * (A4 + tw * (A5 + tw * A6)))))) * 0.1
+                deswt = (A1 + tw * (2 * A2 + tw * (3 * A3 + tw * (4 * A4 + tw * (5 * A5 + tw * 6 * A6))))) * 0.1
+                
+                diff = eswt - 0.000660 * (1 + 0.00115 * tw) * (t - tw) * sp - e
+                deriv = deswt + 0.000660 * sp * (1 + 0.00115 * tw - 0.00115 * (t - tw))
+                tw_new = tw - diff / deriv
+                
+                if abs(tw_new - tw) < tolerance:
+                    tw = tw_new
+                    converged = True
+                    break
+                tw = tw_new
+                
+                if tw < td - 5 or tw > t + 5:
+                    break
+            
+            out[i] = tw
+            if not converged:
+                unconverged += 1
+        return unconverged
+else:
+    _wet_bulb_kernel = None
+
+
+def calculate_wet_bulb_temperature(T, ea, SP, max_iterations=10, tolerance=0.01):
     """
-    Calculate wet-bulb temperature using iterative process.
+    Calculate wet-bulb temperature using Newton's method.
+    
+    All elements are solved in parallel; elements stop updating once they
+    converge or leave the [Td - 5, T + 5] bounds. Uses a Numba-compiled
+    kernel when numba is installed and the NumPy solver otherwise. The
+    result is float32 if all inputs are float32 and float64 otherwise.
     
     Args:
-        T: Air temperature (dry-bulb) in °C
-        ea: Vapor pressure in kPa
-        SP: Standard air pressure in kPa
+        T: Air temperature (dry-bulb) in °C (scalar or array)
+        ea: Vapor pressure in kPa (scalar or array)
+        SP: Standard air pressure in kPa (scalar or array)
         max_iterations: Maximum number of iterations
         tolerance: Convergence tolerance in °C
     
     Returns:
-        Tw: Wet-bulb temperature in °C
+        Tw: Wet-bulb temperature in °C (NaN where any input is missing)
     """
-    # Handle edge cases
-    if pd.isna(T) or pd.isna(ea) or pd.isna(SP):
-        return np.nan
+    T, ea, SP = np.asarray(T), np.asarray(ea), np.asarray(SP)
+    dtype = np.result_type(T, ea, SP, np.float32)
+    T, ea, SP = np.broadcast_arrays(
+        T.astype(dtype, copy=False), ea.astype(dtype, copy=False), SP.astype(dtype, copy=False)
+    )
     
-    # Calculate dewpoint as initial guess
-    Td = calculate_dewpoint(ea)
-    if pd.isna(Td):
-        return np.nan
-    
-    # Initial guess for wet-bulb temperature
-    Tw = Td
-    
-    for i in range(max_iterations):
-        # Calculate vapor pressure at current wet-bulb temperature
-        ewt = calculate_wet_bulb_vapor_pressure(T, Tw, SP)
-        
-        # Calculate difference from actual vapor pressure
-        diff = ewt - ea
-        
-        # Adjust wet-bulb temperature estimate
-        # Simple gradient descent approach
-        Tw_new = Tw - diff * 0.5  # Adjustment factor
-        
-        # Check for convergence
-        if abs(Tw_new - Tw) < tolerance:
-            return Tw_new
-        
-        Tw = Tw_new
-        
-        # Ensure wet-bulb temperature stays within reasonable bounds
-        if Tw < Td - 5 or Tw > T + 5:
-            break
-    
-    # If no convergence, return best estimate
-    logger.debug(f"Wet-bulb calculation did not converge for T={T}, ea={ea}, SP={SP}")
-    return Tw
+    if _wet_bulb_kernel is not None:
+        Tw = np.empty(T.shape, dtype=dtype)
+        unconverged = _wet_bulb_kernel(
+            np.ascontiguousarray(T).ravel(), np.ascontiguousarray(ea).ravel(),
+            np.ascontiguousarray(SP).ravel(), Tw.reshape(-1), max_iterations, tolerance
+        )
+    else:
+        Tw, unconverged = _solve_wet_bulb_numpy(T, ea, SP, max_iterations, tolerance)
+    
+    # Unconverged elements keep their best estimate
+    if unconverged:
+        logger.debug(f"Wet-bulb calculation did not converge for {unconverged} values")
+    
+    return Tw[()]
 
 
 def calculate_wbgt(black_globe_temp, wet_bulb_temp, dry_bulb_temp):
@@ -150,65 +236,60 @@ def calculate_wbgt(black_globe_temp, wet_bulb_temp, dry_bulb_temp):
         dry_bulb_temp: Dry-bulb (air) temperature in °C
     
     Returns:
-        WBGT: Wet-bulb Globe Temperature index in °C
+        WBGT: Wet-bulb Globe Temperature index in °C (NaN propagates from any input)
     """
-    # Handle edge cases
-    if pd.isna(black_globe_temp) or pd.isna(wet_bulb_temp) or pd.isna(dry_bulb_temp):
-        return np.nan
-    
     # Campbell Scientific equation
     WBGT = (0.2 * black_globe_temp) + (0.7 * wet_bulb_temp) + (0.1 * dry_bulb_temp)
     
     return WBGT
 
 
-def add_meteorological_calculations(df):
+def add_meteorological_calculations(df, precision="float64"):
     """
     Add meteorological calculations to the dataframe.
     
     Args:
         df: DataFrame with meteorological data
+        precision: Float precision of the calculations and output columns,
+            "float64" (default) or "float32"
     
     Returns:
         df: DataFrame with added meteorological parameters
     """
+    if precision not in ("float32", "float64"):
+        raise ValueError(f"Invalid meteorology precision: {precision}. Use 'float32' or 'float64'")
+    dtype = np.dtype(precision)
+    
     logger.info("Calculating meteorological parameters (esat, ea, dewpoint, wet-bulb, WBGT)")
     
     # Create copies for calculations
     df = df.copy()
     
-    # Extract required columns
-    T = df['AirTC_Avg']  # Air temperature (°C)
-    RH = df['RH_Avg']    # Relative humidity (%)
-    P = df['P_Air_Avg']  # Air pressure (mbar)
-    BG = df['BGTemp_C_Avg']  # Black globe temperature (°C)
+    # Extract required columns once as float arrays
+    T = df['AirTC_Avg'].to_numpy(dtype=dtype)  # Air temperature (°C)
+    RH = df['RH_Avg'].to_numpy(dtype=dtype)    # Relative humidity (%)
+    P = df['P_Air_Avg'].to_numpy(dtype=dtype)  # Air pressure (mbar)
+    BG = df['BGTemp_C_Avg'].to_numpy(dtype=dtype)  # Black globe temperature (°C)
     
     # Convert pressure from mbar to kPa
     SP = P * 0.1
     
-    # Calculate saturated vapor pressure
-    df['esat_kPa'] = calculate_saturated_vapor_pressure(T)
-    
-    # Calculate vapor pressure
-    df['ea_kPa'] = calculate_vapor_pressure(RH, df['esat_kPa'])
+    # Calculate saturated vapor pressure, vapor pressure and dewpoint
+    esat = calculate_saturated_vapor_pressure(T)
+    ea = calculate_vapor_pressure(RH, esat)
+    Td = calculate_dewpoint(ea)
     
-    # Calculate dewpoint
-    df['dewpoint_C'] = df['ea_kPa'].apply(calculate_dewpoint)
-    
-    # Calculate wet-bulb temperature (vectorized)
-    logger.info("Calculating wet-bulb temperatures (this may take a moment)...")
-    df['wet_bulb_C'] = df.apply(
-        lambda row: calculate_wet_bulb_temperature(
-            row['AirTC_Avg'], row['ea_kPa'], SP.loc[row.name] if row.name in SP.index else np.nan
-        ), axis=1
-    )
+    # Calculate wet-bulb temperature
+    Tw = calculate_wet_bulb_temperature(T, ea, SP)
     
     # Calculate WBGT
-    df['WBGT_C'] = df.apply(
-        lambda row: calculate_wbgt(
-            row['BGTemp_C_Avg'], row['wet_bulb_C'], row['AirTC_Avg']
-        ), axis=1
-    )
+    WBGT = calculate_wbgt(BG, Tw, T)
+    
+    df['esat_kPa'] = esat
+    df['ea_kPa'] = ea
+    df['dewpoint_C'] = Td
+    df['wet_bulb_C'] = Tw
+    df['WBGT_C'] = WBGT
     
     # Count successful calculations
     count_esat = df['esat_kPa'].count()
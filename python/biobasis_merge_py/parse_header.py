@@ -1,85 +1,125 @@
 """Header parsing for Biobasis data files."""
 
+import csv
+import os
 import pandas as pd
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice, zip_longest
+from typing import Dict, List, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bytes read at a time when parsing a header; usually covers all four lines
+HEADER_READ_SIZE = 8192
+
+# Timestamp column names in priority order
+_TS_CANDIDATES = ('TIMESTAMP', 'timestamp', 'DateTime', 'datetime', 'TIME', 'time')
+
+
+def _read_header(file_path: str) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """Read and parse the 4-line header of a file."""
+    # Read the header as one block, reading more only if it is longer than that
+    with open(file_path, 'rb') as f:
+        head = f.read(HEADER_READ_SIZE)
+        while head.count(b'\n') < 4:
+            block = f.read(HEADER_READ_SIZE)
+            if not block:
+                break
+            head += block
+    
+    # csv.reader splits the lines and removes the quotes around values
+    lines = list(islice(csv.reader(head.decode('utf-8', errors='replace').splitlines()), 4))
+    
+    if len(lines) < 4:
+        raise ValueError(f"File {file_path} has fewer than 4 header lines")
+    
+    # Line 2: Column names, Line 3: Units, Line 4: Statistics
+    column_names, units_list, stats_list = lines[1], lines[2], lines[3]
+    
+    # Map column names to units/stats; missing trailing values become ""
+    n_columns = len(column_names)
+    units_dict = dict(zip_longest(column_names, units_list[:n_columns], fillvalue=""))
+    stats_dict = dict(zip_longest(column_names, stats_list[:n_columns], fillvalue=""))
+    
+    logger.debug("Parsed header from %s: %d columns", file_path, len(column_names))
+    return column_names, units_dict, stats_dict
+
+
+@lru_cache(maxsize=4096)
+def _read_header_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """Parse a header once per (path, mtime, size); stale entries are never hit after a file changes."""
+    return _read_header(file_path)
+
 
 def parse_header(file_path: str) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
     """
     Parse 4-line header from Biobasis data file.
     
+    Results are cached per (path, mtime, size), so a file that has not
+    changed is only parsed once per process.
+    
     Returns:
         Tuple of (column_names, units_dict, stats_dict)
     """
     try:
-        with open(file_path, 'r') as f:
-            lines = [f.readline().strip() for _ in range(4)]
-        
-        if len(lines) < 4:
-            raise ValueError(f"File {file_path} has fewer than 4 header lines")
-        
-        # Line 2: Column names (split by comma)
-        column_names = [col.strip('"') for col in lines[1].split(',')]
-        
-        # Line 3: Units (split by comma)
-        units_list = [unit.strip('"') for unit in lines[2].split(',')]
-        
-        # Line 4: Statistics (split by comma)
-        stats_list = [stat.strip('"') for stat in lines[3].split(',')]
-        
-        # Create dictionaries mapping column names to units/stats
-        units_dict = {}
-        stats_dict = {}
-        
-        for i, col_name in enumerate(column_names):
-            if i < len(units_list):
-                units_dict[col_name] = units_list[i]
-            else:
-                units_dict[col_name] = ""
-                
-            if i < len(stats_list):
-                stats_dict[col_name] = stats_list[i]
-            else:
-                stats_dict[col_name] = ""
-        
-        logger.debug(f"Parsed header from {file_path}: {len(column_names)} columns")
-        return column_names, units_dict, stats_dict
+        stat = os.stat(file_path)
+        column_names, units_dict, stats_dict = _read_header_cached(
+            os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+        )
+        # Return copies so callers cannot mutate the cached entry
+        return list(column_names), dict(units_dict), dict(stats_dict)
         
     except Exception as e:
         logger.error(f"Error parsing header from {file_path}: {e}")
         raise
 
 
+def parse_headers_batch(file_paths: List[str]) -> List[Tuple[List[str], Dict[str, str], Dict[str, str]]]:
+    """
+    Parse the headers of several files concurrently.
+    
+    Header parsing is dominated by file I/O, which releases the GIL, so the
+    files are read in a thread pool. Results are returned in input order and
+    can be passed to validate_header_consistency.
+    """
+    if not file_paths:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+        return list(executor.map(parse_header, file_paths))
+
+
 def validate_header_consistency(headers: List[Tuple[List[str], Dict[str, str], Dict[str, str]]]) -> None:
     """Validate that all headers have consistent column structure."""
     if not headers:
         return
     
     reference_columns = headers[0][0]
+    ref_set = frozenset(reference_columns)
     
     for i, (columns, _, _) in enumerate(headers[1:], 1):
-        if columns != reference_columns:
-            logger.warning(f"Header {i} has different columns than reference header")
-            # Log the differences
-            ref_set = set(reference_columns)
-            curr_set = set(columns)
-            missing = ref_set - curr_set
-            extra = curr_set - ref_set
-            if missing:
-                logger.warning(f"Missing columns: {missing}")
-            if extra:
-                logger.warning(f"Extra columns: {extra}")
-
-
-def get_timestamp_column_info(column_names: List[str]) -> str:
-    """Find the timestamp column name."""
-    timestamp_candidates = ['TIMESTAMP', 'timestamp', 'DateTime', 'datetime', 'TIME', 'time']
-    
-    for candidate in timestamp_candidates:
-        if candidate in column_names:
+        if columns == reference_columns:
+            continue
+        
+        logger.warning(f"Header {i} has different columns than reference header")
+        # Log the differences
+        curr_set = frozenset(columns)
+        missing = ref_set - curr_set
+        extra = curr_set - ref_set
+        if missing:
+            logger.warning(f"Missing columns: {set(missing)}")
+        if extra:
+            logger.warning(f"Extra columns: {set(extra)}")
+
+
+@lru_cache(maxsize=32)
+def _find_timestamp_column(column_names: Tuple[str, ...]) -> str:
+    """Find the timestamp column name in a tuple of column names."""
+    column_set = set(column_names)
+    for candidate in _TS_CANDIDATES:
+        if candidate in column_set:
             return candidate
     
     # If no standard timestamp column found, assume first column
@@ -88,3 +128,8 @@ def get_timestamp_column_info(column_names: List[str]) -> str:
         return column_names[0]
     
     raise ValueError("No columns found in header")
+
+
+def get_timestamp_column_info(column_names: Sequence[str]) -> str:
+    """Find the timestamp column name; results are memoized per set of column names."""
+    return _find_timestamp_column(tuple(column_names))
@@ -1,36 +1,66 @@
 """Plot generation using Plotly for interactive HTML visualizations."""
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import math
-from pathlib import Path
+import os
+from itertools import compress
+import re
 from typing import List, Optional
 import logging
 
+try:
+    from tsdownsample import NaNMinMaxLTTBDownsampler
+except ImportError:  # tsdownsample is optional; fall back to stride sampling
+    NaNMinMaxLTTBDownsampler = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# A <script> element that loads or configures plotly (matched on lower-cased bytes)
+_PLOTLY_SCRIPT_PATTERN = re.compile(rb'<script\b[^<]*plotly')
+
+# Options shared by every HTML file written here: plotly.js is loaded from the
+# CDN rather than inlined (about 3.5 MB per file), MathJax is not needed, and the
+# figures are built from validated objects, so re-validation on write is skipped
+_HTML_WRITE_OPTIONS = dict(include_plotlyjs='cdn', include_mathjax=False, validate=False)
+
+# Maximum points per trace in the static HTML output (plotly-resampler's default
+# view size); each trace is downsampled separately
+HTML_POINTS_PER_TRACE = 2000
+
 
 def determine_plot_columns(df: pd.DataFrame, exclude_columns: Optional[List[str]] = None) -> List[str]:
-    """Determine which columns to plot, excluding specified columns."""
+    """
+    Determine which columns to plot, excluding specified columns.
+    
+    Numeric columns are found by dtype with select_dtypes; only object columns
+    are parsed, and are included if at least 10% of their values are numeric.
+    Categorical columns (status codes, flags) are skipped without parsing.
+    """
     if exclude_columns is None:
         exclude_columns = ['TIMESTAMP', 'RECORD', 'timestamp', 'record']
+    excluded = set(exclude_columns)
+    
+    numeric_columns = set(df.select_dtypes(include='number').columns)
+    object_columns = set(df.select_dtypes(include='object').columns)
     
     plot_columns = []
     for col in df.columns:
-        if col not in exclude_columns:
-            # Check if column is numeric or can be converted to numeric
-            if df[col].dtype in ['float64', 'float32', 'int64', 'int32']:
+        if col in excluded:
+            continue
+        if col in numeric_columns:
+            plot_columns.append(col)
+        elif col in object_columns:
+            # Fraction of values that parse as numbers (NaN for an empty frame)
+            if pd.to_numeric(df[col], errors='coerce').notna().mean() >= 0.1:
                 plot_columns.append(col)
-            elif df[col].dtype == 'object':
-                # Try to convert object columns to numeric to see if they contain numbers
-                try:
-                    numeric_values = pd.to_numeric(df[col], errors='coerce')
-                    # Include if at least 10% of values are numeric
-                    if numeric_values.notna().sum() / len(df) >= 0.1:
-                        plot_columns.append(col)
-                except:
-                    continue
     
     logger.debug(f"Selected {len(plot_columns)} columns for plotting: {plot_columns}")
     return plot_columns
@@ -47,20 +77,103 @@ def calculate_subplot_layout(num_plots: int, max_cols: int = 2) -> tuple:
     return rows, cols
 
 
-def downsample_data(df: pd.DataFrame, max_points: int = 200000) -> pd.DataFrame:
-    """Downsample data if it has too many points."""
+# MinMax decimation, used for downsampling only when tsdownsample is missing
+if njit is not None:
+    @njit(cache=True)
+    def _minmax_kernel(y, n_buckets, out):
+        """Write the row indices of each bucket's min and max of y into out (-1 if all NaN)."""
+        n = y.shape[0]
+        for b in range(n_buckets):
+            start = b * n // n_buckets
+            stop = (b + 1) * n // n_buckets
+            i_min = -1
+            i_max = -1
+            for i in range(start, stop):
+                v = y[i]
+                if v != v:  # NaN
+                    continue
+                if i_min < 0 or v < y[i_min]:
+                    i_min = i
+                if i_max < 0 or v > y[i_max]:
+                    i_max = i
+            out[2 * b] = min(i_min, i_max)
+            out[2 * b + 1] = max(i_min, i_max) if i_max != i_min else -1
+else:
+    _minmax_kernel = None
+
+
+def _timestamp_ns(df: pd.DataFrame, timestamp_col: Optional[str]) -> Optional[np.ndarray]:
+    """Return the timestamps as int64 nanoseconds if sorted, else None (downsample by position)."""
+    if timestamp_col is None or not df[timestamp_col].is_monotonic_increasing:
+        return None
+    return pd.DatetimeIndex(df[timestamp_col]).asi8
+
+
+def _series_indices(x: Optional[np.ndarray], y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Return the sorted rows of one series to keep, about n_out of them.
+    
+    Uses MinMaxLTTB from tsdownsample if installed, else the numba MinMax
+    kernel if numba is installed, else every n-th row.
+    """
+    if NaNMinMaxLTTBDownsampler is not None:
+        args = (y,) if x is None else (x, y)
+        return NaNMinMaxLTTBDownsampler().downsample(*args, n_out=max(n_out, 4))
+    
+    if _minmax_kernel is not None:
+        n_buckets = max(n_out // 2, 1)
+        out = np.empty(2 * n_buckets, dtype=np.int64)
+        _minmax_kernel(y, n_buckets, out)
+        return out[out >= 0]  # Buckets are in row order, so this is already sorted
+    
+    return np.arange(0, len(y), math.ceil(len(y) / n_out))
+
+
+def downsample_data(df: pd.DataFrame, max_points: int = 200000, timestamp_col: Optional[str] = None,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Downsample data if it has too many points.
+    
+    The first available method is used:
+    
+    1. tsdownsample (installed with the ``fast`` extra): MinMaxLTTB selects the
+       rows that preserve the shape (peaks, troughs and gaps) of each plotted
+       column, and the union of those rows is kept; the per-column budget keeps
+       the total at max_points.
+    2. numba without tsdownsample (e.g. ``pip install numba`` alone): the rows
+       holding each column's min and max in equal-sized row buckets are kept.
+       This also preserves peaks but selects different rows than MinMaxLTTB.
+    3. Neither installed: every n-th row is kept.
+    """
     if len(df) <= max_points:
         return df
     
+    if NaNMinMaxLTTBDownsampler is not None or _minmax_kernel is not None:
+        if columns is None:
+            columns = determine_plot_columns(df)
+    
+    if (NaNMinMaxLTTBDownsampler is not None or _minmax_kernel is not None) and columns:
+        x = _timestamp_ns(df, timestamp_col)
+        n_out = max(max_points // len(columns), 1)
+        indices = [
+            _series_indices(x, pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64), n_out)
+            for col in columns
+        ]
+        downsampled = df.iloc[np.unique(np.concatenate(indices))]
+        method = 'MinMaxLTTB' if NaNMinMaxLTTBDownsampler is not None else 'MinMax'
+        logger.info(f"Downsampled data from {len(df)} to {len(downsampled)} points ({method})")
+        return downsampled
+    
     # Calculate stride for downsampling
     stride = math.ceil(len(df) / max_points)
-    downsampled = df.iloc[::stride].copy()
+    downsampled = df.iloc[::stride]  # Callers only read the result, so no copy is needed
     
     logger.info(f"Downsampled data from {len(df)} to {len(downsampled)} points (stride={stride})")
     return downsampled
 
 
-def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path: str) -> None:
+def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path: str,
+                             points_per_trace: int = HTML_POINTS_PER_TRACE) -> None:
     """
     Create interactive Plotly time series plots and save to HTML.
     
@@ -68,7 +181,7 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
     - Excludes TIMESTAMP and RECORD columns
     - Combines BGTemp_C_Avg and AirTC_Avg in same subplot with different colors
     - Auto grid layout with max 2 columns  
-    - Downsamples if > 200k rows
+    - Downsamples each trace on its own to about points_per_trace points
     - Saves as interactive HTML
     """
     try:
@@ -86,11 +199,37 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
                 font=dict(size=16)
             )
             fig.update_layout(title="Biobasis Meteorological Data - No Data")
-            fig.write_html(output_path)
+            fig.write_html(output_path, **_HTML_WRITE_OPTIONS)
             return
         
-        # Downsample if necessary
-        plot_df = downsample_data(df)
+        # Convert each plotted column to float32 once; float32 is ample for display
+        # and halves the data embedded in the HTML. The column-major block keeps each
+        # column contiguous and lets all-NaN columns be found in a single pass.
+        y_values = np.empty((len(df), len(all_plot_columns)), dtype=np.float32, order='F')
+        for j, column in enumerate(all_plot_columns):
+            y_values[:, j] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float32, na_value=np.nan)
+        all_null = np.isnan(y_values).all(axis=0)
+        empty_columns = set(compress(all_plot_columns, all_null))
+        
+        # x values for the traces. A tz-aware column would become an object
+        # array of Timestamps, so convert to naive UTC (the axis is labelled UTC)
+        # to keep the x values datetime64[ns]
+        x_series = df[timestamp_col]
+        if isinstance(x_series.dtype, pd.DatetimeTZDtype):
+            x_series = x_series.dt.tz_convert('UTC').dt.tz_localize(None)
+        x_all = x_series.to_numpy()
+        
+        # Downsample each trace on its own, so every trace shows at most about
+        # points_per_trace points however many columns are plotted
+        x_ns = _timestamp_ns(df, timestamp_col)
+        trace_data = {}
+        for j, column in enumerate(all_plot_columns):
+            y = y_values[:, j]
+            if len(y) > points_per_trace and not all_null[j]:
+                rows = _series_indices(x_ns, y, points_per_trace)
+                trace_data[column] = (x_all[rows], y[rows])
+            else:
+                trace_data[column] = (x_all, y)
         
         # Special handling for temperature plots
         temp_columns = ['BGTemp_C_Avg', 'AirTC_Avg']
@@ -121,6 +260,8 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
             rows=rows, 
             cols=cols,
             subplot_titles=subplot_titles,
+            shared_xaxes='all',  # All panels, in every grid column, share the timestamp axis, so zoom is linked
+            x_title="Time (UTC)",
             vertical_spacing=0.1,
             horizontal_spacing=0.1
         )
@@ -134,15 +275,11 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
                 # Special handling for combined temperature plot
                 colors = ['red', 'blue']
                 for j, temp_col in enumerate(temp_columns):
-                    if temp_col in plot_df.columns and not plot_df[temp_col].isnull().all():
-                        # Convert to numeric if needed for plotting
-                        y_data = plot_df[temp_col]
-                        if y_data.dtype == 'object':
-                            y_data = pd.to_numeric(y_data, errors='coerce')
-                        
+                    if temp_col in trace_data and temp_col not in empty_columns:
+                        x_data, y_data = trace_data[temp_col]
                         fig.add_trace(
-                            go.Scatter(
-                                x=plot_df[timestamp_col],
+                            go.Scattergl(
+                                x=x_data,
                                 y=y_data,
                                 mode='lines',
                                 name=temp_col,
@@ -153,20 +290,16 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
                         )
             else:
                 # Regular single column plot
-                if column in plot_df.columns:
-                    # Convert to numeric if needed for plotting
-                    y_data = plot_df[column]
-                    if y_data.dtype == 'object':
-                        y_data = pd.to_numeric(y_data, errors='coerce')
-                    
+                if column in trace_data:
                     # Skip columns with all NaN values
-                    if y_data.isnull().all():
+                    if column in empty_columns:
                         logger.debug(f"Skipping column {column} - all NaN values")
                         continue
                     
+                    x_data, y_data = trace_data[column]
                     fig.add_trace(
-                        go.Scatter(
-                            x=plot_df[timestamp_col],
+                        go.Scattergl(
+                            x=x_data,
                             y=y_data,
                             mode='lines',
                             name=column,
@@ -187,16 +320,11 @@ def create_time_series_plots(df: pd.DataFrame, timestamp_col: str, output_path:
             showlegend=has_temp_data  # Only show legend for temperature plot
         )
         
-        # Update x-axis labels
-        for i in range(1, rows + 1):
-            for j in range(1, cols + 1):
-                fig.update_xaxes(title_text="Time (UTC)", row=i, col=j)
-        
         # Save to HTML
         fig.write_html(
             output_path,
-            include_plotlyjs='cdn',
-            config={'displayModeBar': True, 'displaylogo': False}
+            config={'displayModeBar': True, 'displaylogo': False},
+            **_HTML_WRITE_OPTIONS
         )
         
         effective_plots = len(all_plot_columns) if not has_temp_data else len(all_plot_columns) - 1
@@ -246,7 +374,7 @@ def create_summary_plot(merge_summary: dict, output_path: str) -> None:
         
         # Save summary plot separately
         summary_path = output_path.replace('.html', '_summary.html')
-        fig.write_html(summary_path)
+        fig.write_html(summary_path, **_HTML_WRITE_OPTIONS)
         
         logger.info(f"Created summary plot: {summary_path}")
         
@@ -255,23 +383,20 @@ def create_summary_plot(merge_summary: dict, output_path: str) -> None:
 
 
 def validate_plot_output(output_path: str) -> bool:
-    """Validate that plot file was created successfully."""
-    plot_file = Path(output_path)
-    
-    if not plot_file.exists():
-        return False
-    
-    # Check file size (should be > 0)
-    if plot_file.stat().st_size == 0:
-        return False
+    """
+    Validate that plot file was created successfully.
     
-    # Basic content check (should contain plotly)
+    The file must be non-empty and reference plotly from a <script> element in
+    its first 1 KiB, which is read in binary mode to avoid decoding.
+    """
+    # Open once; existence, size and content checks all use the same handle
     try:
-        with open(plot_file, 'r') as f:
-            content = f.read(1000)  # Read first 1000 chars
-            if 'plotly' not in content.lower():
+        with open(output_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
                 return False
-    except Exception:
+            # Basic content check (a script element should load or configure plotly)
+            head = f.read(1024).lower()
+    except OSError:
         return False
     
-    return True
+    return _PLOTLY_SCRIPT_PATTERN.search(head) is not None
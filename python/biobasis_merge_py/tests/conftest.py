@@ -0,0 +1,35 @@
+"""Shared fixtures for the biobasis_merge_py tests."""
+
+import pytest
+import pandas as pd
+
+
+@pytest.fixture(scope="session")
+def df_48_tz():
+    """One day of half-hourly UTC data with two numeric columns (read-only)."""
+    return pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=48, freq='30min', tz='UTC'),
+        'RECORD': range(48),
+        'temperature': [20 + i * 0.1 for i in range(48)],
+        'humidity': [65 + i * 0.2 for i in range(48)]
+    })
+
+
+@pytest.fixture(scope="session")
+def df_no_numeric():
+    """Half-hourly UTC data without numeric columns to plot (read-only)."""
+    return pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=10, freq='30min', tz='UTC'),
+        'RECORD': range(10),
+        'text_col': ['a'] * 10
+    })
+
+
+@pytest.fixture(scope="session")
+def df_all_nan():
+    """Half-hourly UTC data whose only numeric column is all NaN (read-only)."""
+    return pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=10, freq='30min', tz='UTC'),
+        'RECORD': range(10),
+        'temperature': [float('nan')] * 10
+    })
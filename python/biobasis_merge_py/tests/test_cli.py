@@ -1,9 +1,7 @@
 """Tests for CLI functionality."""
 
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
 from unittest.mock import patch
 from biobasis_merge_py.cli import create_parser, main
 from biobasis_merge_py.main import main_pipeline
@@ -23,60 +21,74 @@ def test_create_parser():
     assert args.dry_run is False
     assert args.overwrite is False
     assert args.log_level == 'INFO'
+    assert args.no_plots is False
     
     # Test optional arguments
-    args = parser.parse_args(['--config', 'test.yaml', '--dry-run', '--overwrite', '--log-level', 'DEBUG'])
+    args = parser.parse_args(['--config', 'test.yaml', '--dry-run', '--overwrite', '--log-level', 'DEBUG', '--no-plots'])
     assert args.dry_run is True
     assert args.overwrite is True
     assert args.log_level == 'DEBUG'
+    assert args.no_plots is True
 
 
-def test_cli_main_with_missing_config():
+def test_cli_main_with_missing_config(tmp_path):
     """Test CLI main function with missing config file."""
-    with tempfile.NamedTemporaryFile(suffix='.yaml', delete=False) as f:
-        config_path = f.name
-    
-    # Delete the file so it doesn't exist
-    Path(config_path).unlink()
+    config_path = str(tmp_path / 'missing.yaml')
     
     with patch('sys.argv', ['biobasis_merge_py', '--config', config_path]):
         with pytest.raises(SystemExit):
             main()
 
 
-def test_cli_dry_run():
+def write_config(tmp_path):
+    """Write a config with a nonexistent input dir; tmp_path also holds its JSON sidecar."""
+    config = {
+        'input_dir': '/nonexistent/input',
+        'output_dir': str(tmp_path / 'output'),
+        'date_start': '20240101',
+        'date_end': '20240102'
+    }
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.dump(config))
+    return str(config_path)
+
+
+def test_cli_dry_run(tmp_path):
     """Test CLI dry run functionality."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        config = {
-            'input_dir': '/nonexistent/input',
-            'output_dir': '/tmp/output',
-            'date_start': '20240101',
-            'date_end': '20240102'
-        }
-        yaml.dump(config, f)
-        config_path = f.name
+    config_path = write_config(tmp_path)
     
-    try:
-        # This should not raise an exception even with nonexistent input dir
-        main_pipeline(config_path, dry_run=True)
-    finally:
-        Path(config_path).unlink()
+    # This should not raise an exception even with nonexistent input dir
+    main_pipeline(config_path, dry_run=True)
 
 
-def test_cli_validation_errors():
+def test_cli_validation_errors(tmp_path):
     """Test CLI validation with invalid configuration."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        config = {
-            'input_dir': '/nonexistent/input',
-            'output_dir': '/tmp/output',
-            'date_start': '20240101',
-            'date_end': '20240102'
-        }
-        yaml.dump(config, f)
-        config_path = f.name
+    config_path = write_config(tmp_path)
+    
+    with pytest.raises(ValueError, match="No input files found"):
+        main_pipeline(config_path, dry_run=False)
+
+
+def test_pipeline_warns_on_inconsistent_headers(tmp_path, caplog):
+    """Test that the pipeline checks headers across files before loading them."""
+    input_dir = tmp_path / 'input'
+    input_dir.mkdir()
+    columns = 'TIMESTAMP,RECORD,AirTC_Avg,RH_Avg,P_Air_Avg,BGTemp_C_Avg'
+    for day, extra in [('01', ''), ('02', ',WS_ms_Avg')]:
+        (input_dir / f'Biobasis_MM1_202401{day}.dat').write_text(
+            f"TOA5,Biobasis_MM1\n{columns}{extra}\nTS,RN,C,%,mbar,C{extra and ',m/s'}\n"
+            f"Avg,Avg,Avg,Avg,Avg,Avg{extra and ',Avg'}\n2024-01-{day} 00:00:00,0,15,60,1000,16{extra and ',2'}\n"
+        )
+    config = {
+        'input_dir': str(input_dir),
+        'output_dir': str(tmp_path / 'output'),
+        'date_start': '20240101',
+        'date_end': '20240102'
+    }
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.dump(config))
+    
+    main_pipeline(str(config_path), no_plots=True)
     
-    try:
-        with pytest.raises(ValueError, match="No input files found"):
-            main_pipeline(config_path, dry_run=False)
-    finally:
-        Path(config_path).unlink()
+    assert "Header 1 has different columns than reference header" in caplog.text
+    assert "Extra columns: {'WS_ms_Avg'}" in caplog.text
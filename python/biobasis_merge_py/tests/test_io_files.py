@@ -0,0 +1,141 @@
+"""Tests for file I/O functionality."""
+
+import pytest
+import pandas as pd
+from datetime import datetime
+from biobasis_merge_py.io_files import read_data_file, load_all_files
+
+
+HEADER = '''TOA5,Biobasis_MM1,CR6,12345,CR6.Std.03.02,CPU:Biobasis.CR6,12345,Biobasis_MM1
+"TIMESTAMP","RECORD","AirTC_Avg","RH_Avg"
+"TS","RN","Deg C","%"
+"","","Avg","Avg"
+'''
+
+
+def write_data_file(path, rows, header=HEADER):
+    """Write a Biobasis data file with the given header (standard by default) and data rows."""
+    path.write_text(header + '\n'.join(rows) + '\n')
+    return str(path)
+
+
+def test_read_data_file(tmp_path):
+    """Test reading a data file with typed columns."""
+    file_path = write_data_file(tmp_path / 'Biobasis_MM1_20240101.dat', [
+        '"2024-01-01 00:00:00",0,15.2,65.5',
+        '"2024-01-01 00:30:00",1,"NAN",66.0',
+    ])
+
+    df, units, stats = read_data_file(file_path)
+
+    assert list(df.columns) == ['TIMESTAMP', 'RECORD', 'AirTC_Avg', 'RH_Avg']
+    assert pd.api.types.is_datetime64_any_dtype(df['TIMESTAMP'])
+    assert df['AirTC_Avg'].iloc[0] == pytest.approx(15.2)
+    assert pd.isna(df['AirTC_Avg'].iloc[1])
+    assert units['AirTC_Avg'] == 'Deg C'
+    assert stats['RH_Avg'] == 'Avg'
+
+
+def test_read_data_file_pandas_fallback_matches(tmp_path, monkeypatch):
+    """Test that the pandas fallback reader produces the same frame as PyArrow."""
+    from biobasis_merge_py import io_files
+
+    # SlrW_Avg is all "NAN", as written by a failed sensor
+    header = (HEADER.replace('"RH_Avg"', '"RH_Avg","SlrW_Avg"')
+              .replace('"%"', '"%","W/m^2"')
+              .replace('"Avg","Avg"', '"Avg","Avg","Avg"'))
+    file_path = write_data_file(tmp_path / 'Biobasis_MM1_20240101.dat', [
+        '"2024-01-01 00:00:00",0,15.2,65.5,"NAN"',
+        '"2024-01-01 00:30:00",1,"NAN",66.0,"NAN"',
+    ], header=header)
+
+    df, _, _ = read_data_file(file_path)
+    monkeypatch.setattr(io_files, 'pa_csv', None)
+    fallback_df, _, _ = read_data_file(file_path)
+
+    pd.testing.assert_frame_equal(df, fallback_df)
+    assert df['SlrW_Avg'].dtype == 'float64'
+    assert df['SlrW_Avg'].isna().all()
+
+
+@pytest.mark.parametrize('use_pyarrow', [True, False])
+def test_read_data_file_coerces_mixed_columns(tmp_path, monkeypatch, use_pyarrow):
+    """Test that columns with stray text values are still coerced to numeric."""
+    from biobasis_merge_py import io_files
+
+    if not use_pyarrow:
+        monkeypatch.setattr(io_files, 'pa_csv', None)
+    file_path = write_data_file(tmp_path / 'Biobasis_MM1_20240101.dat', [
+        '"2024-01-01 00:00:00",0,15.2,65.5',
+        '"2024-01-01 00:30:00",1,"ERR",66.0',
+    ])
+
+    df, _, _ = read_data_file(file_path)
+
+    assert pd.api.types.is_float_dtype(df['AirTC_Avg'])
+    assert pd.isna(df['AirTC_Avg'].iloc[1])
+
+
+def test_read_data_file_text_column_categorical(tmp_path):
+    """Test that text columns with repeated values are stored as categoricals."""
+    file_path = write_data_file(tmp_path / 'Biobasis_MM1_20240101.dat', [
+        '"2024-01-01 00:00:00",0,"a","OK"',
+        '"2024-01-01 00:30:00",1,"b","OK"',
+        '"2024-01-01 01:00:00",2,"c","OK"',
+    ])
+
+    df, _, _ = read_data_file(file_path)
+
+    assert isinstance(df['RH_Avg'].dtype, pd.CategoricalDtype)
+    assert list(df['RH_Avg']) == ['OK', 'OK', 'OK']
+    assert df['AirTC_Avg'].dtype == object  # All values distinct
+
+
+def test_load_all_files_preserves_order_and_skips_failures(tmp_path):
+    """Test that files load in input order and unreadable files are skipped."""
+    file_list = []
+    for day in range(1, 6):
+        file_path = write_data_file(tmp_path / f'Biobasis_MM1_202401{day:02d}.dat', [
+            f'"2024-01-{day:02d} 00:00:00",{day},{day}.0,50.0',
+        ])
+        file_list.append((datetime(2024, 1, day), file_path))
+    file_list.insert(2, (datetime(2024, 1, 10), str(tmp_path / 'missing.dat')))
+
+    dataframes, units_list, stats_list = load_all_files(file_list)
+
+    assert len(dataframes) == len(units_list) == len(stats_list) == 5
+    assert [df['RECORD'].iloc[0] for df in dataframes] == [1, 2, 3, 4, 5]
+
+
+def test_load_all_files_empty():
+    """Test loading an empty file list."""
+    assert load_all_files([]) == ([], [], [])
+
+
+def test_check_file_existence(tmp_path):
+    """Test splitting expected files into existing and missing lists."""
+    from biobasis_merge_py.io_files import check_file_existence
+
+    existing_path = write_data_file(tmp_path / 'Biobasis_MM1_20240101.dat', [])
+    missing_path = str(tmp_path / 'Biobasis_MM1_20240102.dat')
+    other_dir_path = str(tmp_path / 'missing_dir' / 'Biobasis_MM1_20240103.dat')
+    file_list = [
+        (datetime(2024, 1, 1), existing_path),
+        (datetime(2024, 1, 2), missing_path),
+        (datetime(2024, 1, 3), other_dir_path),
+    ]
+
+    existing, missing = check_file_existence(file_list)
+
+    assert existing == [file_list[0]]
+    assert missing == file_list[1:]
+
+
+def test_validate_output_paths_without_plots(tmp_path):
+    """Test that the plots path is left out when plots are disabled."""
+    from biobasis_merge_py.io_files import validate_output_paths
+
+    output_files = validate_output_paths(str(tmp_path), '20240101-20240102', include_plots=False)
+
+    assert set(output_files) == {'csv', 'metadata'}
+    assert 'plots' in validate_output_paths(str(tmp_path), '20240101-20240102')
@@ -0,0 +1,68 @@
+"""Tests for main pipeline output helpers."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from biobasis_merge_py.main import save_merged_data
+
+
+def create_merged_dataframe():
+    """Create a merged-style dataframe with a gap row and small float values."""
+    df = pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=4, freq='30min'),
+        'RECORD': [0.0, np.nan, 2.0, 3.0],
+        'AirTC_Avg': [15.2, np.nan, 1.778921886570792e-05, -3.5],
+    })
+    return df
+
+
+@pytest.mark.parametrize('use_pyarrow', [True, False])
+def test_save_merged_data(tmp_path, monkeypatch, use_pyarrow):
+    """Test CSV output format with both the PyArrow and pandas writers."""
+    from biobasis_merge_py import main
+
+    if not use_pyarrow:
+        monkeypatch.setattr(main, 'pa_csv', None)
+    df = create_merged_dataframe()
+    output_path = tmp_path / 'merged.csv'
+
+    save_merged_data(df, {'csv': str(output_path)})
+
+    lines = output_path.read_text().splitlines()
+    assert lines[0] == 'TIMESTAMP,RECORD,AirTC_Avg'
+    assert lines[2] == '2024-01-01 00:30:00,NaN,NaN'
+
+    result = pd.read_csv(output_path, float_precision='round_trip')
+    np.testing.assert_array_equal(result['AirTC_Avg'].to_numpy(), df['AirTC_Avg'].to_numpy())
+    assert 'TIMESTAMP' in df.columns and pd.api.types.is_datetime64_any_dtype(df['TIMESTAMP'])
+
+
+def test_save_merged_data_writers_match(tmp_path, monkeypatch):
+    """Test that the PyArrow and pandas writers produce identical bytes."""
+    import pyarrow as pa
+    from biobasis_merge_py import main
+
+    df = create_merged_dataframe()
+    df['Integral'] = [0.0, -0.0, 3.0, 1e15]
+    df['Small'] = [1e-05, 0.0001, float('inf'), 123456789012345.0]
+    df['Float32'] = np.array([0.0, 1.778921886570792e-05, np.nan, 0.0001], dtype=np.float32)
+    df['Count'] = [1, 2, 3, 4]
+    df['Flag'] = [True, False, True, True]
+    df['NullableFlag'] = pd.array([True, None, False, True], dtype='boolean')
+    df['NullableCount'] = pd.array([1, None, 3, 4], dtype='Int64')
+    df['Status'] = ['OK', np.nan, 'ERR', 'OK']
+    df['Category'] = pd.Categorical(['a', 'b', None, 'a'])
+
+    # Call the PyArrow writer directly so a silent fallback cannot hide a mismatch
+    arrow_path = tmp_path / 'arrow.csv'
+    main._write_csv_pyarrow(df, str(arrow_path))
+    monkeypatch.setattr(main, 'pa_csv', None)
+    pandas_path = tmp_path / 'pandas.csv'
+    save_merged_data(df, {'csv': str(pandas_path)})
+
+    assert arrow_path.read_bytes() == pandas_path.read_bytes()
+
+    # Types without matching formatting are left to to_csv
+    df['Duration'] = pd.to_timedelta([0, 30, 60, 90], unit='min')
+    with pytest.raises(pa.ArrowTypeError):
+        main._write_csv_pyarrow(df, str(arrow_path))
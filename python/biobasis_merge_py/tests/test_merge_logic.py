@@ -30,6 +30,20 @@ def test_concatenate_dataframes():
     assert list(result['value']) == [1, 2, 3, 4]
 
 
+def test_concatenate_categorical_columns():
+    """Test that categorical columns with different categories stay categorical."""
+    df1 = create_test_dataframe(['2024-01-01 00:00:00'], [1])
+    df2 = create_test_dataframe(['2024-01-01 00:30:00'], [2])
+    df1['flag'] = pd.Categorical(['OK'])
+    df2['flag'] = pd.Categorical(['ERR'])
+    
+    result = concatenate_dataframes([df1, df2])
+    
+    assert isinstance(result['flag'].dtype, pd.CategoricalDtype)
+    assert list(result['flag']) == ['OK', 'ERR']
+    assert list(df1['flag'].cat.categories) == ['OK']
+
+
 def test_concatenate_empty_list():
     """Test concatenation with empty dataframe list."""
     with pytest.raises(ValueError, match="No dataframes to concatenate"):
@@ -50,6 +64,25 @@ def test_sort_by_timestamp():
     assert list(result['value']) == expected_order
 
 
+def test_sort_by_timestamp_stable():
+    """Test that rows with equal timestamps keep their input order."""
+    df = create_test_dataframe(
+        ['2024-01-01 01:00:00', '2024-01-01 00:00:00', '2024-01-01 01:00:00', '2024-01-01 00:30:00'],
+        [1, 2, 3, 4]
+    )
+    
+    result = sort_by_timestamp(df, 'TIMESTAMP')
+    
+    assert list(result['value']) == [2, 4, 1, 3]
+
+
+def test_sort_by_timestamp_already_sorted():
+    """Test that already-sorted data is returned without sorting."""
+    df = create_test_dataframe(['2024-01-01 00:00:00', '2024-01-01 00:30:00'], [1, 2])
+    
+    assert sort_by_timestamp(df, 'TIMESTAMP') is df
+
+
 def test_sort_missing_column():
     """Test sorting with missing timestamp column."""
     df = pd.DataFrame({'value': [1, 2, 3]})
@@ -94,6 +127,23 @@ def test_create_complete_time_index_multi_day():
     assert len(index) == 96
     assert index[0] == pd.Timestamp('2024-01-01 00:00:00')
     assert index[-1] == pd.Timestamp('2024-01-02 23:30:00')
+
+
+def test_create_complete_time_index_matches_date_range():
+    """Test that a multi-year index matches pandas date_range exactly."""
+    index = create_complete_time_index(datetime(2020, 1, 1), datetime(2025, 12, 31))
+    
+    expected = pd.date_range('2020-01-01 00:00:00', '2025-12-31 23:30:00', freq='30min')
+    assert index.equals(expected)
+
+
+def test_create_complete_time_index_cached():
+    """Test that the same date range returns the cached index."""
+    index = create_complete_time_index(datetime(2024, 1, 1), datetime(2024, 1, 2))
+    
+    assert create_complete_time_index(datetime(2024, 1, 1), datetime(2024, 1, 2)) is index
+
+
 def test_reindex_to_complete_grid():
     """Test reindexing to complete 30-minute grid."""
     # Create sparse dataframe
@@ -116,6 +166,14 @@ def test_reindex_to_complete_grid():
     assert result.iloc[2]['value'] == 2      # 01:00 should be 2
 
 
+def test_reindex_to_complete_grid_rejects_duplicates():
+    """Test that duplicate timestamps are rejected when reindexing."""
+    df = create_test_dataframe(['2024-01-01 00:00:00', '2024-01-01 00:00:00'], [1, 2])
+    
+    with pytest.raises(pd.errors.MergeError):
+        reindex_to_complete_grid(df, 'TIMESTAMP', datetime(2024, 1, 1), datetime(2024, 1, 1))
+
+
 def test_merge_daily_data():
     """Test complete merge pipeline."""
     # Create two dataframes with some overlap and gaps
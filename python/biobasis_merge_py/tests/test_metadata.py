@@ -0,0 +1,56 @@
+"""Tests for metadata consolidation."""
+
+from biobasis_merge_py.metadata import consolidate_metadata, create_metadata_dataframe
+
+
+def test_consolidate_metadata_first_non_empty():
+    """Test that the first non-empty value is used for each column."""
+    units_list = [
+        {'TIMESTAMP': 'TS', 'AirTC_Avg': '', 'RH_Avg': ' % '},
+        {'TIMESTAMP': 'TS', 'AirTC_Avg': 'Deg C', 'RH_Avg': 'fraction'},
+    ]
+    stats_list = [
+        {'TIMESTAMP': '', 'AirTC_Avg': 'Avg', 'RH_Avg': ''},
+        {'TIMESTAMP': '', 'AirTC_Avg': 'Smp', 'RH_Avg': 'Avg'},
+    ]
+
+    units, stats = consolidate_metadata(units_list, stats_list)
+
+    assert units == {'TIMESTAMP': 'TS', 'AirTC_Avg': 'Deg C', 'RH_Avg': '%'}
+    assert stats == {'TIMESTAMP': '', 'AirTC_Avg': 'Avg', 'RH_Avg': 'Avg'}
+
+
+def test_consolidate_metadata_column_union():
+    """Test that columns missing from some files are still included."""
+    units, stats = consolidate_metadata(
+        [{'AirTC_Avg': 'Deg C'}, {'WS_ms_Avg': 'm/s'}],
+        [{'AirTC_Avg': 'Avg'}, {'BP_mbar': 'Avg'}]
+    )
+
+    assert units == {'AirTC_Avg': 'Deg C', 'WS_ms_Avg': 'm/s', 'BP_mbar': ''}
+    assert stats == {'AirTC_Avg': 'Avg', 'BP_mbar': 'Avg', 'WS_ms_Avg': ''}
+
+
+def test_consolidate_metadata_empty():
+    """Test consolidation with no metadata."""
+    assert consolidate_metadata([], []) == ({}, {})
+
+
+def test_create_metadata_dataframe():
+    """Test the tidy metadata dataframe layout."""
+    df = create_metadata_dataframe({'RH_Avg': '%', 'AirTC_Avg': 'Deg C'}, {'RH_Avg': 'Avg', 'AirTC_Avg': 'Avg'})
+
+    assert list(df.columns) == ['column_name', 'unit', 'statistic']
+    assert list(df['column_name']) == ['AirTC_Avg', 'RH_Avg']
+
+
+def test_consolidate_metadata_shared_schema():
+    """Test consolidation when every file has the same header."""
+    units_list = [{'TIMESTAMP': 'TS', 'AirTC_Avg': ' Deg C', 'RH_Avg': ''}] * 3
+    stats_list = [{'TIMESTAMP': '', 'AirTC_Avg': 'Avg', 'RH_Avg': 'Avg'}] * 3
+
+    units, stats = consolidate_metadata(units_list, stats_list)
+
+    assert list(units) == ['TIMESTAMP', 'AirTC_Avg', 'RH_Avg']
+    assert units == {'TIMESTAMP': 'TS', 'AirTC_Avg': 'Deg C', 'RH_Avg': ''}
+    assert stats == {'TIMESTAMP': '', 'AirTC_Avg': 'Avg', 'RH_Avg': 'Avg'}
@@ -0,0 +1,110 @@
+"""Tests for meteorological calculations."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from biobasis_merge_py.meteorology import (
+    calculate_saturated_vapor_pressure, calculate_dewpoint,
+    calculate_wet_bulb_vapor_pressure, calculate_wet_bulb_temperature,
+    add_meteorological_calculations
+)
+
+
+def test_calculate_dewpoint_edge_cases():
+    """Test dewpoint calculation with missing and non-positive vapor pressure."""
+    result = calculate_dewpoint(np.array([np.nan, 0.0, -1.0, 0.61078]))
+
+    assert np.isnan(result[:3]).all()
+    assert result[3] == pytest.approx(0.0)
+
+
+def test_calculate_dewpoint_scalar():
+    """Test that scalar vapor pressure gives a scalar dewpoint, as for wet-bulb temperature."""
+    result = calculate_dewpoint(0.61078)
+
+    assert np.ndim(result) == 0 and not isinstance(result, np.ndarray)
+    assert result == pytest.approx(0.0)
+
+
+def test_calculate_wet_bulb_temperature_converges():
+    """Test that the wet-bulb solution satisfies the psychrometric equation."""
+    T = np.array([-10.0, 5.0, 20.0, 35.0])
+    RH = np.array([90.0, 60.0, 50.0, 20.0])
+    SP = np.full(4, 101.3)
+    ea = RH * calculate_saturated_vapor_pressure(T) / 100
+
+    Tw = calculate_wet_bulb_temperature(T, ea, SP)
+
+    residual = calculate_wet_bulb_vapor_pressure(T, Tw, SP) - ea
+    assert np.abs(residual).max() < 1e-4
+    assert (Tw <= T).all()
+
+
+def test_calculate_wet_bulb_temperature_scalar_matches_array():
+    """Test that scalar input gives the same result as array input."""
+    T = np.array([15.0, np.nan])
+    ea = np.array([1.2, 1.2])
+    SP = np.array([100.0, 100.0])
+
+    Tw = calculate_wet_bulb_temperature(T, ea, SP)
+
+    assert calculate_wet_bulb_temperature(15.0, 1.2, 100.0) == pytest.approx(Tw[0])
+    assert np.isnan(Tw[1])
+
+
+def test_add_meteorological_calculations():
+    """Test that derived columns are added and missing inputs propagate NaN."""
+    df = pd.DataFrame({
+        'AirTC_Avg': [20.0, 25.0, np.nan],
+        'RH_Avg': [50.0, 70.0, 60.0],
+        'P_Air_Avg': [1013.0, 1000.0, 1010.0],
+        'BGTemp_C_Avg': [30.0, 35.0, 30.0]
+    })
+
+    result = add_meteorological_calculations(df)
+
+    for col in ['esat_kPa', 'ea_kPa', 'dewpoint_C', 'wet_bulb_C', 'WBGT_C']:
+        assert col in result.columns
+        assert result[col].notna().sum() == 2
+
+    expected_wbgt = 0.2 * 30.0 + 0.7 * result['wet_bulb_C'][0] + 0.1 * 20.0
+    assert result['WBGT_C'][0] == pytest.approx(expected_wbgt)
+    assert 'esat_kPa' not in df.columns  # Input is not modified
+
+
+def test_wet_bulb_numba_matches_numpy(monkeypatch):
+    """Test that the Numba kernel and the NumPy solver agree."""
+    pytest.importorskip('numba')
+    from biobasis_merge_py import meteorology
+
+    rng = np.random.default_rng(0)
+    T = rng.uniform(-20, 40, 500)
+    ea = rng.uniform(5, 100, 500) * calculate_saturated_vapor_pressure(T) / 100
+    SP = rng.uniform(95, 105, 500)
+    T[::50] = np.nan
+
+    jit_result = calculate_wet_bulb_temperature(T, ea, SP)
+    monkeypatch.setattr(meteorology, '_wet_bulb_kernel', None)
+    numpy_result = calculate_wet_bulb_temperature(T, ea, SP)
+
+    np.testing.assert_allclose(jit_result, numpy_result, rtol=1e-9, atol=1e-9)
+
+
+def test_add_meteorological_calculations_float32():
+    """Test that float32 precision gives float32 columns close to the float64 result."""
+    df = pd.DataFrame({
+        'AirTC_Avg': [-5.0, 20.0, 35.0],
+        'RH_Avg': [90.0, 50.0, 20.0],
+        'P_Air_Avg': [1013.0, 1000.0, 1010.0],
+        'BGTemp_C_Avg': [0.0, 30.0, 45.0]
+    })
+
+    expected = add_meteorological_calculations(df)
+    result = add_meteorological_calculations(df, precision='float32')
+
+    for col in ['esat_kPa', 'ea_kPa', 'dewpoint_C', 'wet_bulb_C', 'WBGT_C']:
+        assert result[col].dtype == np.float32
+        np.testing.assert_allclose(result[col], expected[col], atol=1e-3)
+
+    with pytest.raises(ValueError, match="Invalid meteorology precision"):
+        add_meteorological_calculations(df, precision='float16')
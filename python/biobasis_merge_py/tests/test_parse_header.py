@@ -4,7 +4,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from biobasis_merge_py.parse_header import (
-    parse_header, validate_header_consistency, get_timestamp_column_info
+    parse_header, parse_headers_batch, validate_header_consistency, get_timestamp_column_info
 )
 
 
@@ -78,6 +78,27 @@ def test_parse_header_quoted_values():
         Path(file_path).unlink()
 
 
+def test_parse_header_quoted_comma():
+    """Test that quoted values containing commas stay in one field."""
+    content = '''TOA5,Biobasis_MM1,CR6,12345,CR6.Std.03.02,CPU:Biobasis.CR6,12345,Biobasis_MM1
+"TIMESTAMP","RECORD","SlrW_Avg"\r
+"TS","RN","W/m^2, total"\r
+"","","Avg"\r
+'''
+    
+    file_path = create_test_file(content)
+    
+    try:
+        columns, units, stats = parse_header(file_path)
+        
+        assert columns == ['TIMESTAMP', 'RECORD', 'SlrW_Avg']
+        assert units['SlrW_Avg'] == 'W/m^2, total'
+        assert stats['SlrW_Avg'] == 'Avg'
+        
+    finally:
+        Path(file_path).unlink()
+
+
 def test_parse_header_insufficient_lines():
     """Test parsing header with insufficient lines."""
     content = '''TOA5,Biobasis_MM1,CR6,12345,CR6.Std.03.02,CPU:Biobasis.CR6,12345,Biobasis_MM1
@@ -116,6 +137,27 @@ Avg
         Path(file_path).unlink()
 
 
+def test_parse_headers_batch():
+    """Test that batch parsing returns headers in input order."""
+    file_paths = [
+        create_test_file(f'''TOA5,Biobasis_MM1
+TIMESTAMP,RECORD,Sensor_{i}
+TS,RN,Deg C
+,,Avg
+''')
+        for i in range(5)
+    ]
+    
+    try:
+        headers = parse_headers_batch(file_paths)
+        
+        assert [columns[2] for columns, _, _ in headers] == [f'Sensor_{i}' for i in range(5)]
+        assert parse_headers_batch([]) == []
+    finally:
+        for file_path in file_paths:
+            Path(file_path).unlink()
+
+
 def test_validate_header_consistency():
     """Test header consistency validation."""
     headers = [
@@ -149,3 +191,57 @@ def test_get_timestamp_column_info():
     # Empty columns
     with pytest.raises(ValueError, match="No columns found"):
         get_timestamp_column_info([])
+
+
+def test_get_timestamp_column_info_memoized():
+    """Test that lists and tuples of the same columns share one cached lookup."""
+    from biobasis_merge_py.parse_header import _find_timestamp_column
+
+    columns = ['RECORD', 'TIMESTAMP', 'WS_ms_Avg']
+    get_timestamp_column_info(columns)
+    hits = _find_timestamp_column.cache_info().hits
+
+    assert get_timestamp_column_info(tuple(columns)) == 'TIMESTAMP'
+    assert _find_timestamp_column.cache_info().hits == hits + 1
+
+
+def test_parse_header_longer_than_read_block(monkeypatch):
+    """Test that headers longer than one read block are parsed completely."""
+    from biobasis_merge_py import parse_header as parse_header_module
+
+    monkeypatch.setattr(parse_header_module, 'HEADER_READ_SIZE', 16)
+    columns = ['TIMESTAMP', 'RECORD'] + [f'Sensor_{i}_Avg' for i in range(20)]
+    content = '\n'.join([
+        'TOA5,Biobasis_MM1,CR6',
+        ','.join(f'"{col}"' for col in columns),
+        ','.join(['"TS"', '"RN"'] + ['"Deg C"'] * 20),
+        ','.join(['""', '""'] + ['"Avg"'] * 20),
+    ]) + '\n2024-01-01 00:00:00,0\n'
+    file_path = create_test_file(content)
+
+    try:
+        parsed_columns, units, stats = parse_header(file_path)
+
+        assert parsed_columns == columns
+        assert units['Sensor_19_Avg'] == 'Deg C'
+        assert stats['Sensor_19_Avg'] == 'Avg'
+    finally:
+        Path(file_path).unlink()
+
+
+def test_parse_header_cache_invalidated_on_change(tmp_path):
+    """Test that cached headers are reused until the file changes."""
+    header = '''TOA5,Biobasis_MM1
+"TIMESTAMP","RECORD","AirTC_Avg"
+"TS","RN","Deg C"
+"","","Avg"
+'''
+    file_path = tmp_path / 'Biobasis_MM1_20240101.dat'
+    file_path.write_text(header)
+
+    columns, units, _ = parse_header(str(file_path))
+    units['AirTC_Avg'] = 'changed'
+    assert parse_header(str(file_path))[1]['AirTC_Avg'] == 'Deg C'
+
+    file_path.write_text(header.replace('"AirTC_Avg"', '"AirTC_Avg","RH_Avg"'))
+    assert parse_header(str(file_path))[0] == columns + ['RH_Avg']
@@ -1,9 +1,8 @@
 """Tests for plot generation functionality."""
 
 import pytest
+import numpy as np
 import pandas as pd
-import tempfile
-from pathlib import Path
 from biobasis_merge_py.plots import (
     determine_plot_columns, calculate_subplot_layout, downsample_data,
     create_time_series_plots, validate_plot_output
@@ -27,6 +26,20 @@ def test_determine_plot_columns():
     assert set(plot_columns) == set(expected)
 
 
+def test_determine_plot_columns_mixed_types():
+    """Test that mostly-numeric object columns are kept in column order."""
+    df = pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=4, freq='30min'),
+        'mostly_numeric': ['1.5', 'ERR', '2.5', '3.0'],
+        'float32_col': pd.Series([1, 2, 3, 4], dtype='float32'),
+        'int16_col': pd.Series([1, 2, 3, 4], dtype='int16'),
+        'flag': pd.Categorical(['OK'] * 4)
+    })
+    
+    assert determine_plot_columns(df) == ['mostly_numeric', 'float32_col', 'int16_col']
+    assert determine_plot_columns(df.iloc[:0]) == ['float32_col', 'int16_col']
+
+
 def test_determine_plot_columns_custom_exclude():
     """Test plot column determination with custom exclusions."""
     df = pd.DataFrame({
@@ -75,105 +88,188 @@ def test_downsample_data():
     assert len(result) > 0
 
 
-def test_create_time_series_plots():
-    """Test time series plot creation."""
-    # Create test dataframe
+def test_downsample_data_preserves_peaks():
+    """Test that MinMaxLTTB keeps extreme values that stride sampling would skip."""
+    pytest.importorskip('tsdownsample')
+    values = [0.0] * 1000
+    values[501] = 50.0
     df = pd.DataFrame({
-        'TIMESTAMP': pd.date_range('2024-01-01', periods=48, freq='30T', tz='UTC'),
-        'RECORD': range(48),
-        'temperature': [20 + i * 0.1 for i in range(48)],
-        'humidity': [65 + i * 0.2 for i in range(48)]
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=1000, freq='30min'),
+        'value': values
     })
     
-    with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-        output_path = f.name
+    result = downsample_data(df, max_points=100, timestamp_col='TIMESTAMP')
     
-    try:
-        create_time_series_plots(df, 'TIMESTAMP', output_path)
-        
-        # Check that file was created
-        assert Path(output_path).exists()
-        assert Path(output_path).stat().st_size > 0
-        
-        # Validate plot output
-        assert validate_plot_output(output_path)
-        
-    finally:
-        Path(output_path).unlink()
+    assert len(result) <= 100
+    assert result['value'].max() == 50.0
+    assert result['TIMESTAMP'].is_monotonic_increasing
 
 
-def test_create_time_series_plots_no_data():
-    """Test plot creation with no numeric columns."""
+def test_downsample_data_stride_fallback(monkeypatch):
+    """Test stride downsampling when neither tsdownsample nor numba is installed."""
+    from biobasis_merge_py import plots
+    
+    monkeypatch.setattr(plots, 'NaNMinMaxLTTBDownsampler', None)
+    monkeypatch.setattr(plots, '_minmax_kernel', None)
+    df = pd.DataFrame({'value': range(1000)})
+    
+    result = downsample_data(df, max_points=100)
+    
+    assert list(result['value']) == list(range(0, 1000, 10))
+
+
+def test_downsample_data_numba_minmax(monkeypatch):
+    """Test the numba MinMax branch, used when numba is installed without tsdownsample."""
+    pytest.importorskip('numba')
+    from biobasis_merge_py import plots
+    
+    monkeypatch.setattr(plots, 'NaNMinMaxLTTBDownsampler', None)
+    values = [0.0] * 1000
+    values[501] = 50.0
+    values[700:800] = [float('nan')] * 100
     df = pd.DataFrame({
-        'TIMESTAMP': pd.date_range('2024-01-01', periods=10, freq='30T', tz='UTC'),
-        'RECORD': range(10),
-        'text_col': ['a'] * 10
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=1000, freq='30min'),
+        'value': values
     })
     
-    with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-        output_path = f.name
+    result = downsample_data(df, max_points=100, timestamp_col='TIMESTAMP')
     
-    try:
-        create_time_series_plots(df, 'TIMESTAMP', output_path)
-        
-        # Should still create a file with "no data" message
-        assert Path(output_path).exists()
-        
-    finally:
-        Path(output_path).unlink()
+    assert len(result) <= 100
+    assert result['value'].max() == 50.0
+    assert result['value'].notna().all()
+    assert result['TIMESTAMP'].is_monotonic_increasing
 
+    # Exactly the rows holding each bucket's min and max (first occurrence), NaN skipped
+    n_buckets = 100 // 2
+    values = df['value'].to_numpy()
+    expected = set()
+    for b in range(n_buckets):
+        bucket = values[b * 1000 // n_buckets:(b + 1) * 1000 // n_buckets]
+        if not np.isnan(bucket).all():
+            offset = b * 1000 // n_buckets
+            expected.update({offset + int(np.nanargmin(bucket)), offset + int(np.nanargmax(bucket))})
+    assert list(result.index) == sorted(expected)
 
-def test_create_time_series_plots_all_nan():
-    """Test plot creation with all NaN values."""
+
+@pytest.fixture(scope="module")
+def rendered_plot(tmp_path_factory, df_48_tz):
+    """Render one time series plot shared by the tests that inspect it."""
+    output_path = tmp_path_factory.mktemp('plots') / 'time_series.html'
+    create_time_series_plots(df_48_tz, 'TIMESTAMP', str(output_path))
+    return output_path
+
+
+def test_create_time_series_plots(rendered_plot):
+    """Test time series plot creation."""
+    assert rendered_plot.exists()
+
+
+def test_create_time_series_plots_not_empty(rendered_plot):
+    """Test that the rendered plot file has content."""
+    assert rendered_plot.stat().st_size > 0
+
+
+def test_create_time_series_plots_valid(rendered_plot):
+    """Test that the rendered plot passes output validation."""
+    assert validate_plot_output(str(rendered_plot))
+
+
+def test_create_time_series_plots_tz_aware_x_is_datetime64(tmp_path, monkeypatch, df_48_tz):
+    """Test that tz-aware timestamps reach the traces as datetime64, not object Timestamps."""
+    import plotly.graph_objects as go
+    
+    figures = []
+    monkeypatch.setattr(go.Figure, 'write_html', lambda fig, *args, **kwargs: figures.append(fig))
+    
+    create_time_series_plots(df_48_tz, 'TIMESTAMP', str(tmp_path / 'plot.html'))
+    
+    x = figures[0].data[0].x
+    assert x.dtype == 'datetime64[ns]'
+    assert x[0] == pd.Timestamp('2024-01-01 00:00:00').to_datetime64()
+
+
+def test_create_time_series_plots_points_per_trace(tmp_path, monkeypatch):
+    """Test that each trace is downsampled to its own budget, not a union of picks."""
+    import plotly.graph_objects as go
+    
+    figures = []
+    monkeypatch.setattr(go.Figure, 'write_html', lambda fig, *args, **kwargs: figures.append(fig))
+    
+    n = 5000
+    rng = np.random.default_rng(0)
     df = pd.DataFrame({
-        'TIMESTAMP': pd.date_range('2024-01-01', periods=10, freq='30T', tz='UTC'),
-        'RECORD': range(10),
-        'temperature': [float('nan')] * 10
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=n, freq='min'),
+        **{f'col{i}': rng.normal(size=n) for i in range(4)}
     })
     
-    with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-        output_path = f.name
+    create_time_series_plots(df, 'TIMESTAMP', str(tmp_path / 'plot.html'), points_per_trace=200)
+    
+    traces = figures[0].data
+    assert len(traces) == 4
+    for trace in traces:
+        assert 0 < len(trace.x) == len(trace.y) <= 200
     
-    try:
-        create_time_series_plots(df, 'TIMESTAMP', output_path)
-        
-        # Should create file even with all NaN data
-        assert Path(output_path).exists()
-        
-    finally:
-        Path(output_path).unlink()
+    # Each trace keeps its own rows
+    assert not np.array_equal(traces[0].x, traces[1].x)
 
 
-def test_validate_plot_output():
+def test_create_time_series_plots_shared_x_axes(tmp_path, monkeypatch):
+    """Test that every subplot's x-axis is linked to one anchor, across grid columns."""
+    import plotly.graph_objects as go
+    
+    figures = []
+    monkeypatch.setattr(go.Figure, 'write_html', lambda fig, *args, **kwargs: figures.append(fig))
+    
+    df = pd.DataFrame({
+        'TIMESTAMP': pd.date_range('2024-01-01', periods=10, freq='30min'),
+        **{f'col{i}': np.arange(10.0) + i for i in range(5)}
+    })
+    
+    create_time_series_plots(df, 'TIMESTAMP', str(tmp_path / 'plot.html'))
+    
+    layout = figures[0].layout
+    x_axes = [name for name in layout if name.startswith('xaxis')]
+    assert len(x_axes) == 6  # 3 x 2 grid, the last cell empty
+    anchors = {layout[name].matches or name.replace('axis', '') for name in x_axes}
+    assert len(anchors) == 1
+
+
+def test_create_time_series_plots_no_data(tmp_path, df_no_numeric):
+    """Test plot creation with no numeric columns."""
+    output_path = tmp_path / 'plot.html'
+    
+    create_time_series_plots(df_no_numeric, 'TIMESTAMP', str(output_path))
+    
+    # Should still create a file with "no data" message
+    assert output_path.exists()
+
+
+def test_create_time_series_plots_all_nan(tmp_path, df_all_nan):
+    """Test plot creation with all NaN values."""
+    output_path = tmp_path / 'plot.html'
+    
+    create_time_series_plots(df_all_nan, 'TIMESTAMP', str(output_path))
+    
+    # Should create file even with all NaN data
+    assert output_path.exists()
+
+
+def test_validate_plot_output(tmp_path):
     """Test plot output validation."""
     # Test non-existent file
     assert not validate_plot_output('/nonexistent/file.html')
     
     # Test empty file
-    with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-        empty_file = f.name
-    
-    try:
-        assert not validate_plot_output(empty_file)
-    finally:
-        Path(empty_file).unlink()
+    empty_file = tmp_path / 'empty.html'
+    empty_file.touch()
+    assert not validate_plot_output(str(empty_file))
     
     # Test valid HTML file with plotly content
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-        f.write('<html><head><script src="plotly.js"></script></head></html>')
-        valid_file = f.name
-    
-    try:
-        assert validate_plot_output(valid_file)
-    finally:
-        Path(valid_file).unlink()
+    valid_file = tmp_path / 'valid.html'
+    valid_file.write_text('<html><head><script src="plotly.js"></script></head></html>')
+    assert validate_plot_output(str(valid_file))
     
     # Test invalid HTML file without plotly
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-        f.write('<html><head></head><body>No plotly here</body></html>')
-        invalid_file = f.name
-    
-    try:
-        assert not validate_plot_output(invalid_file)
-    finally:
-        Path(invalid_file).unlink()
+    invalid_file = tmp_path / 'invalid.html'
+    invalid_file.write_text('<html><head></head><body>No plotly here</body></html>')
+    assert not validate_plot_output(str(invalid_file))
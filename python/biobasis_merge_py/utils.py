@@ -1,19 +1,106 @@
 """Utilities for configuration parsing, date handling, and logging setup."""
 
+import copy
+import json
 import logging
-import yaml
-from datetime import datetime, timedelta
+import os
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+
+# pandas and yaml are imported where used, so the date helpers import quickly
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+_logging_configured = False
 
 
 def setup_logging(level: str = "INFO") -> None:
-    """Setup logging configuration."""
+    """Setup logging configuration; later calls only change the level."""
+    global _logging_configured
+    log_level = _LOG_LEVELS.get(level.upper(), logging.INFO)
+    
+    if _logging_configured:
+        logging.getLogger().setLevel(log_level)
+        return
+    
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=log_level,
         format='%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
+    _logging_configured = True
+
+
+def _read_config_sidecar(sidecar_path: str, mtime_ns: int, size: int) -> Any:
+    """Return the config stored in a JSON sidecar, or None if missing or stale."""
+    try:
+        with open(sidecar_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('source') != [mtime_ns, size]:
+        return None
+    return cached.get('config')
+
+
+def _write_config_sidecar(sidecar_path: str, mtime_ns: int, size: int, config: Any) -> None:
+    """Atomically write a JSON sidecar; skipped if the directory is read-only or the config is not JSON."""
+    try:
+        text = json.dumps({'source': [mtime_ns, size], 'config': config})
+    except (TypeError, ValueError) as e:
+        logger.debug("Config %s not cached: %s", sidecar_path, e)
+        return
+    
+    # JSON turns non-string keys into strings, so only cache configs that round-trip unchanged
+    if json.loads(text)['config'] != config:
+        logger.debug("Config %s not cached: it does not round-trip through JSON", sidecar_path)
+        return
+    
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", sidecar_path, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=100)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Any:
+    """Load a YAML file once per (path, mtime, size).
+    
+    The parsed config is also kept in a ``<config>.json`` sidecar stamped with
+    the YAML file's mtime and size, so later processes can skip YAML parsing.
+    """
+    sidecar_path = config_path + '.json'
+    config = _read_config_sidecar(sidecar_path, mtime_ns, size)
+    if config is not None:
+        return config
+    
+    import yaml
+    # libyaml's C loader when PyYAML was built with it, else the pure-Python loader
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=loader)
+    
+    _write_config_sidecar(sidecar_path, mtime_ns, size, config)
+    return config
 
 
 def parse_config(config_path: str) -> Dict[str, Any]:
@@ -22,8 +109,9 @@ def parse_config(config_path: str) -> Dict[str, Any]:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    stat = config_file.stat()
+    # Deep copy so callers cannot mutate the cached config
+    config = copy.deepcopy(_load_config_cached(str(config_file.resolve()), stat.st_mtime_ns, stat.st_size))
     
     # Validate required fields
     required_fields = ['input_dir', 'output_dir', 'date_start', 'date_end']
@@ -34,19 +122,27 @@ def parse_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+@lru_cache(maxsize=256)
 def parse_date(date_str: str) -> datetime:
     """Parse date string in YYYYMMDD or YYYY-MM-DD format."""
-    # Try YYYYMMDD format first
+    # Build the common fixed-width forms directly; strptime is much slower
     try:
-        return datetime.strptime(date_str, '%Y%m%d')
+        if len(date_str) == 8 and date_str.isdigit():
+            return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+        if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+                and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()):
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
     except ValueError:
         pass
     
-    # Try YYYY-MM-DD format
-    try:
-        return datetime.strptime(date_str, '%Y-%m-%d')
-    except ValueError:
-        raise ValueError(f"Invalid date format: {date_str}. Use YYYYMMDD or YYYY-MM-DD")
+    # Fall back to strptime for anything else, e.g. unpadded YYYY-M-D
+    for date_format in ('%Y%m%d', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(date_str, date_format)
+        except ValueError:
+            pass
+    
+    raise ValueError(f"Invalid date format: {date_str}. Use YYYYMMDD or YYYY-MM-DD")
 
 
 def format_date_range(date_start: datetime, date_end: datetime) -> str:
@@ -56,14 +152,16 @@ def format_date_range(date_start: datetime, date_end: datetime) -> str:
     return f"{start_str}-{end_str}"
 
 
+def generate_date_index(date_start: datetime, date_end: datetime) -> "pd.DatetimeIndex":
+    """Generate daily DatetimeIndex from start to end (inclusive)."""
+    import pandas as pd
+    
+    return pd.date_range(date_start, date_end, freq='D')
+
+
 def generate_date_list(date_start: datetime, date_end: datetime) -> List[datetime]:
     """Generate list of dates from start to end (inclusive)."""
-    dates = []
-    current_date = date_start
-    while current_date <= date_end:
-        dates.append(current_date)
-        current_date += timedelta(days=1)
-    return dates
+    return generate_date_index(date_start, date_end).to_pydatetime().tolist()
 
 
 def validate_output_dir(output_dir: str, create: bool = True) -> Path:
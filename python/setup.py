@@ -1,35 +1,10 @@
 #!/usr/bin/env python
-"""Setup script for biobasis_merge_py package."""
+"""Setup script for biobasis_merge_py package.
 
-from setuptools import setup, find_packages
+Package metadata lives in pyproject.toml; this shim keeps legacy
+``python setup.py`` invocations working.
+"""
 
-with open("requirements.txt", "r", encoding="utf-8") as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+from setuptools import setup
 
-setup(
-    name="biobasis_merge_py",
-    version="1.0.0",
-    description="Meteorological data merging tool for biobasis stations",
-    author="Biobasis Team",
-    author_email="biobasis@example.com",
-    packages=find_packages(),
-    python_requires=">=3.8",
-    install_requires=requirements,
-    entry_points={
-        "console_scripts": [
-            "biobasis-merge=biobasis_merge_py.cli:main",
-        ],
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Science/Research",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Scientific/Engineering :: Atmospheric Science",
-    ],
-    keywords="meteorology, data processing, biobasis",
-)
+setup()
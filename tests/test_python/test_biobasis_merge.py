@@ -1,12 +1,14 @@
 """Simple tests for biobasis_merge_py package."""
 
+import logging
 import pytest
+import yaml
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timezone
 
-from biobasis_merge_py.utils import setup_logging, parse_config
+from biobasis_merge_py.utils import setup_logging, parse_config, parse_date
 from biobasis_merge_py.parse_header import parse_header
 
 
@@ -17,16 +19,15 @@ class TestUtils:
         """Test logging setup."""
         # Test that setup_logging doesn't raise an error
         setup_logging('DEBUG')
+        handler_count = len(logging.getLogger().handlers)
         setup_logging('INFO')
-        # Basic test - if it doesn't crash, it works
-        assert True
+        
+        # Repeated calls change the level without adding handlers
+        assert logging.getLogger().level == logging.INFO
+        assert len(logging.getLogger().handlers) == handler_count
     
-    def test_parse_config(self):
+    def test_parse_config(self, tmp_path):
         """Test configuration parsing."""
-        # Create a temporary config file
-        import tempfile
-        import os
-        
         valid_config = {
             'input_dir': 'tests/data',
             'output_dir': 'data/output',
@@ -37,23 +38,79 @@ class TestUtils:
             'log_level': 'INFO'
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            import yaml
-            yaml.dump(valid_config, f)
-            temp_config_path = f.name
+        # Write one temporary config (tmp_path also holds its JSON sidecar)
+        temp_config_path = tmp_path / 'config.yaml'
+        with open(temp_config_path, 'w') as f:
+            yaml.dump(valid_config, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+        
+        # Should not raise any exception
+        config = parse_config(str(temp_config_path))
+        assert config['input_dir'] == 'tests/data'
+        assert config['station_id'] == 'MM1'
         
-        try:
-            # Should not raise any exception
-            config = parse_config(temp_config_path)
-            assert config['input_dir'] == 'tests/data'
-            assert config['station_id'] == 'MM1'
-        finally:
-            os.unlink(temp_config_path)
+        # A second call is served from the cache and returns an equal config
+        assert parse_config(str(temp_config_path)) == config
         
         # Test missing file
         with pytest.raises(FileNotFoundError):
             parse_config('nonexistent.yaml')
 
+    def test_parse_config_cache(self, tmp_path):
+        """Test that cached configs are copied and refreshed on change."""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text(
+            "input_dir: in\noutput_dir: out\ndate_start: '20240101'\ndate_end: '20240103'\n"
+        )
+
+        config = parse_config(str(config_path))
+        config['input_dir'] = 'changed'
+        assert parse_config(str(config_path))['input_dir'] == 'in'
+
+        config_path.write_text(config_path.read_text().replace('input_dir: in', 'input_dir: other'))
+        assert parse_config(str(config_path))['input_dir'] == 'other'
+
+    def test_parse_config_json_sidecar(self, tmp_path):
+        """Test that the JSON sidecar is written and skipped for non-JSON values."""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text(
+            "input_dir: in\noutput_dir: out\ndate_start: '20240101'\ndate_end: '20240103'\n"
+        )
+        parse_config(str(config_path))
+        assert (tmp_path / 'config.yaml.json').exists()
+
+        # Unquoted dates load as datetime.date, which JSON cannot store
+        dated_path = tmp_path / 'dated.yaml'
+        dated_path.write_text("input_dir: in\noutput_dir: out\ndate_start: 2024-01-01\ndate_end: 2024-01-03\n")
+        assert parse_config(str(dated_path))['date_start'].year == 2024
+        assert not (tmp_path / 'dated.yaml.json').exists()
+        assert list(tmp_path.glob('*.tmp')) == []
+
+    def test_parse_config_sidecar_skipped_when_not_json_round_trip(self, tmp_path):
+        """Test that configs JSON would alter (e.g. integer keys) are not cached in a sidecar."""
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text(
+            "input_dir: in\noutput_dir: out\ndate_start: '20240101'\ndate_end: '20240103'\n"
+            "thresholds: {1: a}\n"
+        )
+        
+        assert parse_config(str(config_path))['thresholds'] == {1: 'a'}
+        assert not (tmp_path / 'config.yaml.json').exists()
+        
+        # A fresh process (empty in-memory cache) still sees the integer key
+        from biobasis_merge_py import utils
+        utils._load_config_cached.cache_clear()
+        assert parse_config(str(config_path))['thresholds'] == {1: 'a'}
+
+    def test_parse_date(self):
+        """Test parsing of supported date formats."""
+        assert parse_date('20240131') == datetime(2024, 1, 31)
+        assert parse_date('2024-01-31') == datetime(2024, 1, 31)
+        assert parse_date('2024-1-5') == datetime(2024, 1, 5)
+        
+        for invalid in ['20240231', '2024 1 1', 'not a date']:
+            with pytest.raises(ValueError, match="Invalid date format"):
+                parse_date(invalid)
+
 
 class TestParseHeader:
     """Test header parsing functionality."""
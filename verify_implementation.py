@@ -2,11 +2,15 @@
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
 
 def test_basic_functionality():
-    """Test basic functionality without full dependencies."""
-    print("Testing basic Python implementation...")
+    """Test basic functionality without full dependencies.
+    
+    Returns (passed, report_lines).
+    """
+    lines = ["Testing basic Python implementation..."]
     
     try:
         # Test imports
@@ -17,33 +21,37 @@ def test_basic_functionality():
         date1 = parse_date("20240101")
         date2 = parse_date("2024-01-03")
         date_range = format_date_range(date1, date2)
-        print(f"✓ Date parsing works: {date_range}")
+        lines.append(f"✓ Date parsing works: {date_range}")
         
         # Test timestamp column detection
         columns = ['TIMESTAMP', 'RECORD', 'AirTC_Avg']
         ts_col = get_timestamp_column_info(columns)
-        print(f"✓ Timestamp column detection: {ts_col}")
+        lines.append(f"✓ Timestamp column detection: {ts_col}")
         
         # Test configuration structure
         config_path = os.path.join(os.path.dirname(__file__), 'configs', 'biobasis_merge.yaml')
         if os.path.exists(config_path):
-            print(f"✓ Configuration file exists: {config_path}")
+            lines.append(f"✓ Configuration file exists: {config_path}")
         
         # Test test data
         test_data_dir = os.path.join(os.path.dirname(__file__), 'tests', 'data')
-        test_files = [f for f in os.listdir(test_data_dir) if f.endswith('.dat')]
-        print(f"✓ Test data files: {len(test_files)} files found")
+        with os.scandir(test_data_dir) as entries:
+            n_test_files = sum(1 for e in entries if e.name.endswith('.dat') and e.is_file())
+        lines.append(f"✓ Test data files: {n_test_files} files found")
         
-        print("\n✅ Basic Python implementation tests passed!")
-        return True
+        lines.append("\n✅ Basic Python implementation tests passed!")
+        return True, lines
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
-        return False
+        lines.append(f"❌ Test failed: {e}")
+        return False, lines
 
 def verify_file_structure():
-    """Verify all expected files are present."""
-    print("\nVerifying file structure...")
+    """Verify all expected files are present.
+    
+    Returns (passed, report_lines).
+    """
+    lines = ["\nVerifying file structure..."]
     
     base_dir = os.path.dirname(__file__)
     
@@ -79,54 +87,58 @@ def verify_file_structure():
     missing_files = []
     present_files = []
     
-    for file_path in expected_files:
-        full_path = os.path.join(base_dir, file_path)
-        if os.path.exists(full_path):
-            present_files.append(file_path)
-        else:
-            missing_files.append(file_path)
+    # Check the files concurrently; stat calls release the GIL, which helps on network filesystems
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        exists = executor.map(lambda p: os.path.exists(os.path.join(base_dir, p)), expected_files)
+        for file_path, file_exists in zip(expected_files, exists):
+            if file_exists:
+                present_files.append(file_path)
+            else:
+                missing_files.append(file_path)
     
-    print(f"✓ Present files: {len(present_files)}/{len(expected_files)}")
+    lines.append(f"✓ Present files: {len(present_files)}/{len(expected_files)}")
     
     if missing_files:
-        print("❌ Missing files:")
-        for file_path in missing_files:
-            print(f"  - {file_path}")
-        return False
+        lines.append("❌ Missing files:")
+        lines.extend(f"  - {file_path}" for file_path in missing_files)
+        return False, lines
     else:
-        print("✅ All expected files are present!")
-        return True
+        lines.append("✅ All expected files are present!")
+        return True, lines
 
 def main():
-    """Main test runner."""
-    print("=" * 60)
-    print("BIOBASIS MERGE TOOL - VERIFICATION")
-    print("=" * 60)
+    """Main test runner; the report is collected and written in one go."""
+    rule = "=" * 60
+    report = [rule, "BIOBASIS MERGE TOOL - VERIFICATION", rule]
     
-    structure_ok = verify_file_structure()
-    functionality_ok = test_basic_functionality()
+    structure_ok, structure_lines = verify_file_structure()
+    functionality_ok, functionality_lines = test_basic_functionality()
+    report.extend(structure_lines)
+    report.extend(functionality_lines)
     
-    print("\n" + "=" * 60)
+    report.append("\n" + rule)
     if structure_ok and functionality_ok:
-        print("🎉 ALL VERIFICATION TESTS PASSED!")
-        print("\nThe biobasis_merge tool has been successfully implemented with:")
-        print("- Complete Python implementation with CLI")
-        print("- Complete R implementation with CLI")
-        print("- Synthetic test data")
-        print("- Comprehensive test suites")
-        print("- Documentation and configuration")
-        
-        print("\nNext steps:")
-        print("1. Install Python dependencies: pip install -r python/requirements.txt")
-        print("2. Install R dependencies (see R/DESCRIPTION)")
-        print("3. Run Python version: python -m biobasis_merge_py --config configs/biobasis_merge.yaml --dry-run")
-        print("4. Run R version: Rscript R/main.R --config configs/biobasis_merge.yaml --dry-run")
+        report.append("""🎉 ALL VERIFICATION TESTS PASSED!
+
+The biobasis_merge tool has been successfully implemented with:
+- Complete Python implementation with CLI
+- Complete R implementation with CLI
+- Synthetic test data
+- Comprehensive test suites
+- Documentation and configuration
+
+Next steps:
+1. Install Python dependencies: pip install -r python/requirements.txt
+2. Install R dependencies (see R/DESCRIPTION)
+3. Run Python version: python -m biobasis_merge_py --config configs/biobasis_merge.yaml --dry-run
+4. Run R version: Rscript R/main.R --config configs/biobasis_merge.yaml --dry-run""")
         
     else:
-        print("❌ VERIFICATION FAILED")
-        print("Some tests did not pass. Please check the implementation.")
+        report.append("❌ VERIFICATION FAILED")
+        report.append("Some tests did not pass. Please check the implementation.")
     
-    print("=" * 60)
+    report.append(rule)
+    sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == "__main__":
     main()